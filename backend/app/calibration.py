@@ -0,0 +1,213 @@
+"""
+Offline difficulty calibration of the secret word pools.
+
+For every word of the input pools, compute its top-1000 neighbors, similarity
+spread and whether it clears the room creation threshold, then write a pools
+file containing only the words that pass, re-bucketed by derived difficulty.
+
+    python -m app.calibration --workers 8 --output data/word_pools.calibrated.json
+
+Point WORD_POOLS_PATH at the output to use it. Words are scored in a process
+pool forked after the model is loaded, so workers share the parent's read-only
+vectors instead of each loading their own copy.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from . import embeddings
+from .config import get_settings
+from .embeddings import (
+    WORD_POOLS_PATH,
+    Lexicon,
+    compute_secret_profile,
+    get_eligible_indices,
+    is_lemma_form,
+    is_word_in_vocabulary,
+    load_model,
+    normalize_guess_word,
+)
+
+logger = logging.getLogger(__name__)
+
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# Same threshold create_room applies before accepting a secret
+MIN_MAX_SIMILARITY = 0.6
+
+
+def calibrate_word(item: tuple[str, str]) -> dict:
+    """Compute calibration stats for one (pool, word) pair. Runs in a worker process."""
+    pool, raw_word = item
+    try:
+        return _calibrate_word(pool, raw_word)
+    except Exception as e:
+        # One failing word must not abort the whole pool: it is reported and left out
+        logger.error(f"Failed to calibrate '{raw_word}': {e}")
+        return {
+            "word": raw_word.strip().lower(),
+            "source": raw_word,
+            "pool": pool,
+            "passes": False,
+            "reason": "error",
+            "error": str(e),
+        }
+
+
+def _calibrate_word(pool: str, raw_word: str) -> dict:
+    word = normalize_guess_word(raw_word)
+    result: dict = {"word": word, "source": raw_word, "pool": pool, "passes": False}
+
+    if not is_word_in_vocabulary(word):
+        result["reason"] = "not_in_vocabulary"
+        return result
+    if not is_lemma_form(word):
+        result["reason"] = "not_lemma"
+        return result
+
+    profile = compute_secret_profile(word)
+    top_1000 = profile["top_1000"] if profile else []
+    if not top_1000:
+        result["reason"] = "no_neighbors"
+        return result
+
+    similarities = np.array([entry["similarity"] for entry in top_1000], dtype=np.float32)
+    result.update({
+        "max_similarity": round(float(similarities[0]), 4),
+        "top_10_mean": round(float(similarities[:10].mean()), 4),
+        "top_100_mean": round(float(similarities[:100].mean()), 4),
+        "floor_similarity": round(float(similarities[-1]), 4),
+        "spread": round(float(similarities[0] - similarities[-1]), 4),
+        "neighbors": len(top_1000),
+        "min_similarity": round(profile["min_similarity"], 4),
+    })
+
+    if similarities[0] < MIN_MAX_SIMILARITY:
+        result["reason"] = "below_threshold"
+        return result
+
+    result["passes"] = True
+    return result
+
+
+def assign_difficulty(results: list[dict]) -> None:
+    """Bucket passing words into terciles of top-100 mean similarity (closer neighbors = easier)."""
+    passing = sorted(
+        (result for result in results if result["passes"]),
+        key=lambda result: result["top_100_mean"],
+        reverse=True,
+    )
+    if not passing:
+        return
+    bounds = np.array_split(np.arange(len(passing)), len(DIFFICULTIES))
+    for difficulty, indices in zip(DIFFICULTIES, bounds):
+        for index in indices:
+            passing[index]["difficulty"] = difficulty
+
+
+def load_source_pools(path: Path) -> list[tuple[str, str]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    items: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for pool in DIFFICULTIES:
+        for word in data.get(pool, []):
+            word_str = str(word).strip()
+            if word_str and word_str not in seen:
+                seen.add(word_str)
+                items.append((pool, word_str))
+    return items
+
+
+def calibrate(source: Path, workers: int) -> dict:
+    """Calibrate every word of `source` and return the annotated pools document."""
+    started = time.perf_counter()
+
+    # Load shared state once in the parent; forked workers inherit it copy-on-write
+    load_model().fill_norms()
+    Lexicon.get()
+    get_eligible_indices()
+
+    items = load_source_pools(source)
+    logger.info(f"Calibrating {len(items)} words with {workers} workers...")
+
+    results: list[dict] = []
+    context = multiprocessing.get_context("fork")
+    with context.Pool(processes=workers) as pool:
+        for done, result in enumerate(pool.imap_unordered(calibrate_word, items, chunksize=8), 1):
+            results.append(result)
+            if done % 100 == 0:
+                logger.info(f"Calibrated {done}/{len(items)} words")
+
+    # Keep the first occurrence of each normalized word, in source order
+    order = {item: position for position, item in enumerate(items)}
+    results.sort(key=lambda result: order[(result["pool"], result["source"])])
+    unique: list[dict] = []
+    seen: set[str] = set()
+    for result in results:
+        if result["word"] in seen:
+            continue
+        seen.add(result["word"])
+        unique.append(result)
+
+    assign_difficulty(unique)
+
+    pools: dict[str, list[str]] = {difficulty: [] for difficulty in DIFFICULTIES}
+    for result in unique:
+        if result["passes"]:
+            pools[result["difficulty"]].append(result["word"])
+
+    elapsed = time.perf_counter() - started
+    rejected = sum(1 for result in unique if not result["passes"])
+    logger.info(
+        f"Calibration done in {elapsed:.1f}s: "
+        + ", ".join(f"{key}={len(words)}" for key, words in pools.items())
+        + f", rejected={rejected}"
+    )
+
+    return {
+        **pools,
+        "_calibration": {
+            "model": get_settings().word2vec_filename,
+            # Resources version (model + lexicon): pools are only trusted by the same version
+            "version": embeddings.current_resources().version,
+            "source": source.name,
+            "min_max_similarity": MIN_MAX_SIMILARITY,
+            "elapsed_seconds": round(elapsed, 1),
+            "words": {result["word"]: result for result in unique},
+        },
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Calibrate secret word pools offline.")
+    parser.add_argument("--source", type=Path, default=WORD_POOLS_PATH, help="Input pools JSON")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=WORD_POOLS_PATH.with_name("word_pools.calibrated.json"),
+        help="Annotated output pools JSON",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    # Per-word top-1000 logs would drown the progress output
+    embeddings.logger.setLevel(logging.WARNING)
+
+    document = calibrate(args.source, max(1, args.workers))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    logger.info(f"Wrote calibrated pools to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
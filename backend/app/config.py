@@ -12,6 +12,65 @@ class Settings(BaseSettings):
     word2vec_filename: str = "frWac_no_postag_no_phrase_700_skip_cut50.bin"
     word2vec_cache_dir: str = "./.cache/word2vec"
 
+    # Secret word pools (defaults to data/word_pools.json; see app/calibration.py)
+    word_pools_path: str = ""
+
+    # Lexicon (defaults to backend/OpenLexicon.tsv)
+    lexicon_path: str = ""
+
+    # Hot reload: versions kept in memory so existing rooms keep their model
+    max_resource_versions: int = 2
+    # Extra model URLs POST /api/admin/reload may download from (comma-separated; the
+    # configured WORD2VEC_MODEL_URL is always allowed)
+    reload_model_urls: str = ""
+    # Token for /api/admin endpoints (empty = admin endpoints disabled)
+    admin_token: str = ""
+
+    # Hint ladder: ranks (999 = closest) of the words precomputed as hints at room creation
+    hint_ranks: str = "500,800,950"
+
+    # Room summaries (in-process, rebuilt from guesses on first access)
+    room_summary_top_n: int = 100
+    room_summary_cache_size: int = 512
+    # Guesses accepted by other workers/nodes are folded in at most this late
+    room_summary_refresh_seconds: float = 5.0
+
+    # Guess admission control (token buckets per player+room and per room)
+    guess_rate_per_second: float = 2.0
+    guess_burst: int = 10
+    room_guess_rate_per_second: float = 20.0
+    room_guess_burst: int = 60
+    guess_max_in_flight: int = 32
+    rate_limit_max_keys: int = 10000
+
+    # WebSocket guess channel (/api/rooms/{code}/ws), fan-out limited to this worker
+    room_socket_enabled: bool = True
+    room_socket_queue_size: int = 256
+
+    # Realtime room updates: guesses and reveals coalesced per room and broadcast on this tick
+    realtime_batch_interval_ms: int = 250
+    # Guesses carried per room and per tick; clients resync by cursor beyond that
+    realtime_batch_max_guesses: int = 200
+
+    # Memory diagnostics (/api/admin/diagnostics, see services/diagnostics.py)
+    diagnostics_enabled: bool = False
+    # Start tracemalloc at boot with this many frames when diagnostics are enabled (0 = start it through the API)
+    tracemalloc_frames: int = 0
+    # Fraction of submit_guess calls profiled while tracemalloc is tracing
+    guess_profile_sample_rate: float = 0.0
+
+    # Room affinity across API nodes: "off", "header" or "redirect" (see services/affinity.py)
+    room_affinity: str = "off"
+    node_id: str = ""
+    # Comma-separated name=url list of every node, identical on all nodes
+    cluster_nodes: str = ""
+
+    # Retention: archive finished/idle rooms (interval 0 = only via the CLI)
+    retention_finished_after_hours: float = 24.0
+    retention_idle_after_hours: float = 72.0
+    retention_interval_minutes: float = 0.0
+    retention_batch_size: int = 100
+
     # CORS
     cors_origins: str = "*"
 
@@ -2,26 +2,35 @@ import csv
 import hashlib
 import json
 import logging
-import random
+import os
+import threading
 import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 import numpy as np
-import requests
-from gensim.models import KeyedVectors
 
 from .config import get_settings
+from .utils.packing import pack_top_words
+
+if TYPE_CHECKING:
+    # gensim and requests are imported where used: importing this module stays cheap
+    from gensim.models import KeyedVectors
+
+    from .suggestions import SuggestionIndex
 
 logger = logging.getLogger(__name__)
 
-# Global model instance
-_model: Optional[KeyedVectors] = None
+LEXICON_PATH = Path(__file__).parent.parent / "OpenLexicon.tsv"
 
 
-@lru_cache(maxsize=1)
-def load_lexicon_data() -> tuple[
+# One entry per lexicon file, so an old and a freshly reloaded version can coexist
+@lru_cache(maxsize=2)
+def load_lexicon_data(lexicon_path: Path = LEXICON_PATH) -> tuple[
     set[str],
     set[str],
     dict[str, str],
@@ -29,9 +38,8 @@ def load_lexicon_data() -> tuple[
     set[str],
 ]:
     """Load allowed words, noun lemmas, lemma mappings, and non-verb lemmas."""
-    lexicon_path = Path(__file__).parent.parent / "OpenLexicon.tsv"
     if not lexicon_path.exists():
-        logger.warning("OpenLexicon.tsv not found; skipping lexicon filtering")
+        logger.warning(f"{lexicon_path.name} not found; skipping lexicon filtering")
         return set(), set(), {}, {}, set()
 
     allowed: set[str] = set()
@@ -126,19 +134,17 @@ def normalize_word(word: str) -> str:
 
 
 class Lexicon:
-    """Singleton for centralized lexicon data access."""
+    """Centralized lexicon data access (one instance per loaded resources version)."""
 
-    _instance: Optional["Lexicon"] = None
-
-    def __init__(self):
-        data = load_lexicon_data()
+    def __init__(self, lexicon_path: Path = LEXICON_PATH):
+        data = load_lexicon_data(lexicon_path)
         self.allowed = data[0]
         self.noun_lemmas = data[1]
         self.verb_lemma_by_form = data[2]
         self.noun_lemma_by_form = data[3]
         self.non_verb_lemmas = data[4]
 
-        normalized = load_lexicon_normalized_data()
+        normalized = load_lexicon_normalized_data(lexicon_path)
         self.allowed_by_plain = normalized[0]
         self.non_verb_lemmas_by_plain = normalized[1]
         self.verb_lemma_by_form_plain = normalized[2]
@@ -146,15 +152,13 @@ class Lexicon:
 
     @classmethod
     def get(cls) -> "Lexicon":
-        """Get the singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the lexicon of the current resources version."""
+        return current_resources().lexicon
 
     @classmethod
     def reset(cls) -> None:
-        """Reset singleton (useful for testing)."""
-        cls._instance = None
+        """Drop the current version's lexicon so it is rebuilt (useful for testing)."""
+        current_resources().reset_lexicon()
 
 
 def is_lemma_form(word: str) -> bool:
@@ -174,14 +178,14 @@ def is_lemma_form(word: str) -> bool:
     return True
 
 
-@lru_cache(maxsize=1)
-def load_lexicon_normalized_data() -> tuple[
+@lru_cache(maxsize=2)
+def load_lexicon_normalized_data(lexicon_path: Path = LEXICON_PATH) -> tuple[
     dict[str, str],
     dict[str, str],
     dict[str, str],
     dict[str, str],
 ]:
-    allowed, _, verb_lemma_by_form, noun_lemma_by_form, non_verb_lemmas = load_lexicon_data()
+    allowed, _, verb_lemma_by_form, noun_lemma_by_form, non_verb_lemmas = load_lexicon_data(lexicon_path)
 
     allowed_by_plain: dict[str, str] = {}
     non_verb_lemmas_by_plain: dict[str, str] = {}
@@ -226,7 +230,15 @@ def is_allowed_guess(word: str) -> bool:
 
 
 def download_model(url: str, destination: Path) -> None:
-    """Download the Word2Vec model from URL."""
+    """
+    Download the Word2Vec model from URL.
+
+    The file is written next to its destination under a name of its own, then
+    renamed into place: nodes sharing the cache directory never see a partial
+    model, and concurrent downloads just replace each other's complete file.
+    """
+    import requests
+
     logger.info(f"Downloading Word2Vec model from {url}...")
     logger.info("This may take a few minutes (298 MB)...")
     
@@ -235,48 +247,56 @@ def download_model(url: str, destination: Path) -> None:
     
     total_size = int(response.headers.get('content-length', 0))
     downloaded = 0
+    partial = destination.with_name(f"{destination.name}.{os.getpid()}.part")
     
-    with open(destination, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-            downloaded += len(chunk)
-            if total_size > 0:
-                percent = (downloaded / total_size) * 100
-                if downloaded % (10 * 1024 * 1024) < 8192:  # Log every ~10MB
-                    logger.info(f"Download progress: {percent:.1f}%")
+    try:
+        with open(partial, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+                downloaded += len(chunk)
+                if total_size > 0:
+                    percent = (downloaded / total_size) * 100
+                    if downloaded % (10 * 1024 * 1024) < 8192:  # Log every ~10MB
+                        logger.info(f"Download progress: {percent:.1f}%")
+        if total_size > 0 and downloaded != total_size:
+            raise IOError(f"Incomplete download: {downloaded} of {total_size} bytes")
+        os.replace(partial, destination)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
     
     logger.info(f"Model downloaded to {destination}")
 
 
-def load_model() -> KeyedVectors:
-    """Load the Word2Vec model, downloading if necessary."""
-    global _model
-    
-    if _model is not None:
-        return _model
-    
-    settings = get_settings()
-    
+def load_model_file(url: str, filename: str, cache_dir: str) -> "KeyedVectors":
+    """Load a Word2Vec binary from the cache directory, downloading it if necessary."""
     # Create cache directory if it doesn't exist
-    cache_dir = Path(settings.word2vec_cache_dir)
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
     
-    model_path = cache_dir / settings.word2vec_filename
+    model_path = cache_path / filename
     
     if not model_path.exists():
-        download_model(settings.word2vec_model_url, model_path)
+        download_model(url, model_path)
     else:
         logger.info(f"Using cached model at {model_path}")
     
     logger.info("Loading Word2Vec model...")
-    _model = KeyedVectors.load_word2vec_format(
+    from gensim.models import KeyedVectors
+
+    model = KeyedVectors.load_word2vec_format(
         str(model_path), 
         binary=True, 
         unicode_errors="ignore"
     )
-    logger.info(f"Word2Vec model loaded! Vocabulary size: {len(_model.key_to_index)}")
+    logger.info(f"Word2Vec model loaded! Vocabulary size: {len(model.key_to_index)}")
     
-    return _model
+    return model
+
+
+def load_model() -> "KeyedVectors":
+    """Load the Word2Vec model of the current resources version, downloading if necessary."""
+    return current_resources().model
 
 
 def is_word_in_vocabulary(word: str) -> bool:
@@ -314,56 +334,94 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     return float(dot_product / (norm1 * norm2))
 
 
-def find_min_similarity(secret_word: str, sample_size: int = 1200) -> float:
+def get_eligible_indices() -> np.ndarray:
+    """Vocabulary indices of the words a secret is compared against (allowed words if filtering)."""
+    return current_resources().eligible_indices
+
+
+def compute_eligible_indices(model: "KeyedVectors", lex: "Lexicon") -> np.ndarray:
+    if not lex.allowed:
+        return np.arange(len(model.index_to_key))
+    return np.array(
+        [index for index, key in enumerate(model.index_to_key) if normalize_word(key) in lex.allowed],
+        dtype=np.int64,
+    )
+
+
+def similarity_to_vocabulary(secret_word: str) -> Optional[tuple[np.ndarray, np.ndarray]]:
     """
-    Estimate the minimum similarity by sampling random words.
+    Cosine similarity of the secret word to every eligible vocabulary word, in one pass.
 
-    Returns the 5th percentile of similarities to establish a baseline.
-    Sampling is seeded by the secret word to make results stable.
+    Returns (vocabulary indices, similarities), excluding the secret itself,
+    or None if the secret is not in the vocabulary.
     """
     model = load_model()
-    secret_word_lower = normalize_word(secret_word)
+    secret_index = model.key_to_index.get(normalize_word(secret_word))
+    if secret_index is None:
+        return None
 
-    if secret_word_lower not in model.key_to_index:
-        return 0.1
+    model.fill_norms()
+    secret_norm = model.norms[secret_index]
+    if secret_norm == 0:
+        return None
 
-    secret_embedding = model[secret_word_lower]
+    # Full-matrix product like KeyedVectors.most_similar: no normalized copy of the vectors
+    with np.errstate(divide="ignore", invalid="ignore"):
+        similarities = (model.vectors @ model.vectors[secret_index]) / (model.norms * secret_norm)
 
-    lex = Lexicon.get()
-    if lex.allowed:
-        eligible_words = [word for word in lex.allowed if word in model.key_to_index]
-    else:
-        eligible_words = list(model.key_to_index.keys())
+    eligible = get_eligible_indices()
+    eligible = eligible[eligible != secret_index]
+    values = similarities[eligible].astype(np.float32)
+    # Zero-norm vectors give NaN/inf, which would sort into the top 1000: leave them out
+    finite = np.isfinite(values)
+    if not finite.all():
+        eligible, values = eligible[finite], values[finite]
+    return eligible, values
 
-    if not eligible_words:
-        return 0.1
 
-    seed = int.from_bytes(
-        hashlib.sha256(secret_word_lower.encode("utf-8")).digest()[:4],
-        "big",
-    )
-    rng = random.Random(seed)
-    sample = rng.sample(eligible_words, min(sample_size, len(eligible_words)))
+def compute_similarity_quantiles(similarities: np.ndarray, points: int = 1025) -> np.ndarray:
+    """Sorted-similarity quantile table (ascending, `points` entries from min to max)."""
+    ordered = np.sort(similarities)
+    positions = np.linspace(0, len(ordered) - 1, min(points, len(ordered))).round().astype(np.int64)
+    return ordered[positions]
 
-    similarities = []
-    for word in sample:
-        word_embedding = model[word]
-        sim = cosine_similarity(secret_embedding, word_embedding)
-        similarities.append(sim)
 
-    # Use 5th percentile as the "floor"
-    min_sim = float(np.percentile(similarities, 5))
-    logger.info(
-        f"Min similarity for '{secret_word}': {min_sim:.4f} (5th percentile of {len(sample)} samples)"
-    )
+def similarity_percentile(similarity: float, quantiles: np.ndarray) -> float:
+    """Percentile (0-100) of a raw similarity within a secret's vocabulary distribution."""
+    if len(quantiles) < 2:
+        return 100.0
+    fractions = np.linspace(0.0, 1.0, len(quantiles))
+    return float(np.interp(similarity, quantiles, fractions)) * 100
 
-    return min_sim
 
+def vocabulary_rank(percentile: float, vocabulary_size: int) -> int:
+    """Approximate position among all eligible words from a percentile (1 = the secret itself).
 
-def compute_raw_similarity(embedding1: list[float], embedding2: list[float]) -> float:
+    Interpolated from the quantile table, so only accurate to about vocabulary_size / 1024.
+    """
+    return 2 + round((1 - percentile / 100) * max(0, vocabulary_size - 1))
+
+
+def exact_vocabulary_rank(rank: Optional[int]) -> Optional[int]:
+    """Exact vocabulary rank of a top-1000 word from its rank (999 = closest neighbor)."""
+    # Rank 1 is shared by the last two positions (see get_rank), so it can't be inverted
+    if rank is None or rank < 2:
+        return None
+    return 1001 - rank
+
+
+def _min_similarity_from(similarities: np.ndarray) -> float:
+    # Use 5th percentile as the "floor"
+    return float(np.percentile(similarities, 5))
+
+
+def compute_raw_similarity(
+    embedding1: Union[list[float], np.ndarray],
+    embedding2: Union[list[float], np.ndarray],
+) -> float:
     """Compute raw cosine similarity between two embeddings."""
-    vec1 = np.array(embedding1)
-    vec2 = np.array(embedding2)
+    vec1 = np.asarray(embedding1)
+    vec2 = np.asarray(embedding2)
     return cosine_similarity(vec1, vec2)
 
 
@@ -383,8 +441,8 @@ def apply_top_100_boost(
 
 
 def compute_score_and_temperature(
-    guess_embedding: list[float],
-    secret_embedding: list[float],
+    guess_embedding: Union[list[float], np.ndarray],
+    secret_embedding: Union[list[float], np.ndarray],
     max_similarity: float,
     min_similarity: float = 0.1,
     rank: Optional[int] = None,
@@ -397,11 +455,20 @@ def compute_score_and_temperature(
     - Top-100 words get a progressive boost.
     """
     raw_sim = compute_raw_similarity(guess_embedding, secret_embedding)
+    return score_from_similarity(raw_sim, max_similarity, min_similarity, rank)
 
+
+def score_from_similarity(
+    raw_similarity: float,
+    max_similarity: float,
+    min_similarity: float = 0.1,
+    rank: Optional[int] = None,
+) -> tuple[int, float]:
+    """Score and temperature for an already computed cosine similarity."""
     if max_similarity <= min_similarity:
         return 0, 0.0
 
-    normalized = (raw_sim - min_similarity) / (max_similarity - min_similarity)
+    normalized = (raw_similarity - min_similarity) / (max_similarity - min_similarity)
     normalized = max(0.0, min(1.0, normalized))
     base_score = round(normalized * 99)
     boosted_score = apply_top_100_boost(base_score, rank)
@@ -409,64 +476,106 @@ def compute_score_and_temperature(
     return boosted_score, float(boosted_score)
 
 
-def compute_top_1000(secret_word: str) -> list[dict]:
+def _top_from_similarities(indices: np.ndarray, similarities: np.ndarray, count: int = 1000) -> list[dict]:
+    model = load_model()
+    count = min(count, len(similarities))
+    if count == 0:
+        return []
+    top = np.argpartition(-similarities, count - 1)[:count]
+    top = top[np.argsort(-similarities[top], kind="stable")]
+    return [
+        {"word": model.index_to_key[indices[position]], "similarity": float(similarities[position])}
+        for position in top
+    ]
+
+
+def compute_secret_profile(secret_word: str) -> Optional[dict]:
     """
-    Compute the top 1000 closest words to the secret word.
-    
-    Returns a list of dicts with 'word' and 'similarity' keys,
-    ordered by similarity (highest first).
+    Everything a room needs about its secret, from a single pass over the vocabulary.
+
+    Keys: top_1000 (list of {word, similarity}), min_similarity (exact 5th percentile),
+    quantiles (sorted-similarity table for percentile lookups), vocabulary_size.
     """
-    model = load_model()
-    secret_word_lower = normalize_word(secret_word)
-    
-    if secret_word_lower not in model.key_to_index:
+    profile = similarity_to_vocabulary(secret_word)
+    if profile is None:
         logger.warning(f"Secret word '{secret_word}' not in vocabulary")
-        return []
-    
-    try:
-        lex = Lexicon.get()
-        filter_enabled = bool(lex.allowed)
-        topn = 5000 if filter_enabled else 1000
-
-        # Get most similar words (filter to allowed French words if available)
-        similar_words = model.most_similar(secret_word_lower, topn=topn)
-        
-        result = []
-        for word, similarity in similar_words:
-            if filter_enabled and normalize_word(word) not in lex.allowed:
-                continue
-            result.append({
-                "word": word,
-                "similarity": float(similarity)
-            })
-            if len(result) >= 1000:
-                break
-        
-        if result:
-            logger.info(
-                f"Computed top 1000 for '{secret_word}' (closest: '{result[0]['word']}' @ {result[0]['similarity']:.4f})"
-            )
-        elif filter_enabled:
-            logger.info(f"Computed top 1000 for '{secret_word}' (no allowed words found)")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Error computing top 1000: {e}")
-        return []
+        return None
+
+    indices, similarities = profile
+    if not len(similarities):
+        logger.info(f"Computed top 1000 for '{secret_word}' (no allowed words found)")
+        return None
+
+    top_1000 = _top_from_similarities(indices, similarities)
+    logger.info(
+        f"Computed top 1000 for '{secret_word}' (closest: '{top_1000[0]['word']}' @ {top_1000[0]['similarity']:.4f})"
+    )
+    return {
+        "top_1000": top_1000,
+        "min_similarity": _min_similarity_from(similarities),
+        "quantiles": compute_similarity_quantiles(similarities),
+        "vocabulary_size": int(len(similarities)),
+    }
+
+
+def pack_top_1000(top_1000: list[dict]) -> bytes:
+    """Pack a top-1000 list as vocabulary indices + float16 similarities."""
+    model = load_model()
+    indices = [model.key_to_index[entry["word"]] for entry in top_1000]
+    similarities = [entry["similarity"] for entry in top_1000]
+    return pack_top_words(indices, similarities)
+
+
+def get_word_index(word: str) -> Optional[int]:
+    """Vocabulary index of a word, or None if unknown."""
+    model = load_model()
+    return model.key_to_index.get(normalize_word(word))
+
+
+def get_secret_embedding(secret_word: str, secret_index: Optional[int] = None) -> Optional[np.ndarray]:
+    """
+    Resolve a secret's embedding from the loaded model.
+
+    The stored vocabulary index is used when it still points at the secret word
+    (i.e. the model has not changed since the room was created).
+    """
+    model = load_model()
+    if secret_index is not None and 0 <= secret_index < len(model.index_to_key):
+        if model.index_to_key[secret_index] == secret_word:
+            return model.vectors[secret_index]
+
+    index = model.key_to_index.get(normalize_word(secret_word))
+    if index is None:
+        return None
+    return model.vectors[index]
 
 
 WORD_POOLS_PATH = Path(__file__).parent.parent / "data" / "word_pools.json"
 
 
-@lru_cache(maxsize=1)
 def load_word_pools() -> Optional[dict[str, list[str]]]:
-    """Load precomputed word pools (easy/medium/hard)."""
-    if not WORD_POOLS_PATH.exists():
-        logger.error("Word pools not found at %s", WORD_POOLS_PATH)
+    """Load precomputed word pools (easy/medium/hard) of the current resources version."""
+    return current_resources().word_pools
+
+
+def pools_calibration_version(pools_path: Path) -> Optional[str]:
+    """Resources version (model + lexicon) a pools file was calibrated against (app/calibration.py), if any."""
+    try:
+        with open(pools_path, "r", encoding="utf-8") as f:
+            calibration = json.load(f).get("_calibration")
+    except Exception:
+        return None
+    return calibration.get("version") if isinstance(calibration, dict) else None
+
+
+def read_word_pools(pools_path: Path) -> Optional[dict[str, list[str]]]:
+    """Read and clean a pools file against the current model and lexicon."""
+    if not pools_path.exists():
+        logger.error("Word pools not found at %s", pools_path)
         return None
 
     try:
-        with open(WORD_POOLS_PATH, "r", encoding="utf-8") as f:
+        with open(pools_path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except Exception as exc:
         logger.warning(f"Failed to load word pools: {exc}")
@@ -554,3 +663,246 @@ def get_rank(word: str, top_1000: list[dict]) -> Optional[int]:
             return max(1, rank)
 
     return None
+
+
+def get_rank_from_indices(word: str, top_indices: np.ndarray) -> Optional[int]:
+    """
+    Get the rank for a word from packed top-1000 vocabulary indices.
+
+    Same scale as get_rank: 999 for the closest neighbor, None outside the top 1000.
+    """
+    index = get_word_index(word)
+    if index is None:
+        return None
+    hits = np.flatnonzero(top_indices == index)
+    if not hits.size:
+        return None
+    return max(1, 999 - int(hits[0]))
+
+
+def _file_fingerprint(path: Path) -> str:
+    """SHA-1 of the file bytes: identical across checkouts, image rebuilds and nodes."""
+    if not path.exists():
+        return f"{path.name}:missing"
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class EmbeddingResources:
+    """
+    One version of the model, lexicon and word pools, loaded lazily.
+
+    The version id is derived from the model and the lexicon content (not the pools, which
+    only affect new rooms, so a pools-only change keeps existing rooms on their version),
+    so every worker computes the same id for the same files. Rooms store it at
+    creation and pin it while scoring guesses (see `use_resources`).
+    """
+
+    def __init__(
+        self,
+        model_url: str,
+        model_filename: str,
+        cache_dir: str,
+        lexicon_path: Path,
+        word_pools_path: Path,
+    ):
+        self.model_url = model_url
+        self.model_filename = model_filename
+        self.cache_dir = cache_dir
+        self.lexicon_path = lexicon_path
+        self.word_pools_path = word_pools_path
+        # A new model must come with a new filename (model files are immutable in the cache)
+        self.version = hashlib.sha1(
+            "|".join((
+                model_url,
+                model_filename,
+                _file_fingerprint(lexicon_path),
+            )).encode("utf-8")
+        ).hexdigest()[:12]
+
+        self._model: Optional["KeyedVectors"] = None
+        self._lexicon: Optional[Lexicon] = None
+        self._word_pools: Optional[dict[str, list[str]]] = None
+        self._word_pools_loaded = False
+        # True when the pools were calibrated against this version (model and lexicon, which
+        # both decide the threshold verdict): every word should clear it on the first draw
+        self.word_pools_calibrated = False
+        self._eligible_indices: Optional[np.ndarray] = None
+        self._suggestion_index = None
+        # Separate locks so independent parts can load concurrently
+        self._model_lock = threading.Lock()
+        self._lexicon_lock = threading.Lock()
+        self._word_pools_lock = threading.Lock()
+        self._eligible_lock = threading.Lock()
+        self._suggestion_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, **overrides: str) -> "EmbeddingResources":
+        settings = get_settings()
+        lexicon_path = overrides.get("lexicon_path") or settings.lexicon_path
+        word_pools_path = overrides.get("word_pools_path") or settings.word_pools_path
+        return cls(
+            model_url=overrides.get("model_url") or settings.word2vec_model_url,
+            model_filename=overrides.get("model_filename") or settings.word2vec_filename,
+            cache_dir=settings.word2vec_cache_dir,
+            lexicon_path=Path(lexicon_path) if lexicon_path else LEXICON_PATH,
+            word_pools_path=Path(word_pools_path) if word_pools_path else WORD_POOLS_PATH,
+        )
+
+    @property
+    def model(self) -> "KeyedVectors":
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = load_model_file(self.model_url, self.model_filename, self.cache_dir)
+        return self._model
+
+    @property
+    def lexicon(self) -> Lexicon:
+        if self._lexicon is None:
+            with self._lexicon_lock:
+                if self._lexicon is None:
+                    self._lexicon = Lexicon(self.lexicon_path)
+        return self._lexicon
+
+    def reset_lexicon(self) -> None:
+        with self._lexicon_lock:
+            self._lexicon = None
+
+    @property
+    def word_pools(self) -> Optional[dict[str, list[str]]]:
+        if not self._word_pools_loaded:
+            with self._word_pools_lock:
+                if not self._word_pools_loaded:
+                    # Cleaning normalizes against this version's model and lexicon
+                    with use_resources(self):
+                        self._word_pools = read_word_pools(self.word_pools_path)
+                    self.word_pools_calibrated = (
+                        pools_calibration_version(self.word_pools_path) == self.version
+                    )
+                    self._word_pools_loaded = True
+        return self._word_pools
+
+    @property
+    def eligible_indices(self) -> np.ndarray:
+        if self._eligible_indices is None:
+            with self._eligible_lock:
+                if self._eligible_indices is None:
+                    self._eligible_indices = compute_eligible_indices(self.model, self.lexicon)
+        return self._eligible_indices
+
+    @property
+    def suggestion_index(self) -> "SuggestionIndex":
+        if self._suggestion_index is None:
+            with self._suggestion_lock:
+                if self._suggestion_index is None:
+                    from .suggestions import build_suggestion_index
+
+                    self._suggestion_index = build_suggestion_index(self.model, self.eligible_indices)
+        return self._suggestion_index
+
+    def share_scoring_parts(self, other: "EmbeddingResources") -> None:
+        """Reuse the model, lexicon and derived indexes of a loaded instance of the same version."""
+        if other.version != self.version:
+            raise ValueError(f"Cannot share parts of version {other.version} with {self.version}")
+        self._model = other._model
+        self._lexicon = other._lexicon
+        self._eligible_indices = other._eligible_indices
+        self._suggestion_index = other._suggestion_index
+
+    def loaded_parts(self) -> dict[str, object]:
+        """The parts loaded so far, without triggering any load (for diagnostics)."""
+        parts = {
+            "model": self._model,
+            "lexicon": self._lexicon,
+            "word_pools": self._word_pools,
+            "eligible_indices": self._eligible_indices,
+            "suggestion_index": self._suggestion_index,
+        }
+        return {name: part for name, part in parts.items() if part is not None}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None and self._lexicon is not None and self._word_pools_loaded
+
+    def warm(self) -> None:
+        """Load every part now instead of on first use."""
+        self.lexicon
+        self.model.fill_norms()
+        self.word_pools
+        self.eligible_indices
+        self.suggestion_index
+
+
+_resources_lock = threading.Lock()
+_active_resources: Optional[EmbeddingResources] = None
+_loaded_resources: "OrderedDict[str, EmbeddingResources]" = OrderedDict()
+_pinned_resources: ContextVar[Optional[EmbeddingResources]] = ContextVar("pinned_resources", default=None)
+
+
+def current_resources() -> EmbeddingResources:
+    """Resources pinned for this request, else the active version."""
+    pinned = _pinned_resources.get()
+    if pinned is not None:
+        return pinned
+
+    global _active_resources
+    if _active_resources is None:
+        with _resources_lock:
+            if _active_resources is None:
+                resources = EmbeddingResources.from_settings()
+                _loaded_resources[resources.version] = resources
+                _active_resources = resources
+    return _active_resources
+
+
+@contextmanager
+def use_resources(resources: EmbeddingResources) -> Iterator[EmbeddingResources]:
+    """Route load_model()/Lexicon.get()/load_word_pools() to `resources` within the block."""
+    token = _pinned_resources.set(resources)
+    try:
+        yield resources
+    finally:
+        _pinned_resources.reset(token)
+
+
+def get_resources(version: Optional[str]) -> Optional[EmbeddingResources]:
+    """A loaded resources version by id, if still in memory."""
+    if not version:
+        return None
+    with _resources_lock:
+        return _loaded_resources.get(version)
+
+
+def loaded_resource_versions() -> list[str]:
+    with _resources_lock:
+        return list(_loaded_resources.keys())
+
+
+def release_inactive_resources(keep: int) -> None:
+    """Drop the oldest non-active versions until at most `keep` versions stay loaded."""
+    with _resources_lock:
+        for version in list(_loaded_resources):
+            if len(_loaded_resources) <= keep:
+                break
+            if _active_resources is not None and version == _active_resources.version:
+                continue
+            del _loaded_resources[version]
+            logger.info(f"Released resources version {version}")
+
+
+def activate_resources(resources: EmbeddingResources) -> None:
+    """Atomically make `resources` the active version; older versions beyond the cap are dropped."""
+    global _active_resources
+    max_versions = max(1, get_settings().max_resource_versions)
+    with _resources_lock:
+        _loaded_resources[resources.version] = resources
+        _loaded_resources.move_to_end(resources.version)
+        _active_resources = resources
+        while len(_loaded_resources) > max_versions:
+            version, _ = _loaded_resources.popitem(last=False)
+            logger.info(f"Released resources version {version}")
+    logger.info(f"Activated resources version {resources.version}")
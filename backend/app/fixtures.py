@@ -0,0 +1,246 @@
+"""
+Synthetic model, lexicon and word pools for offline performance testing.
+
+Writes, for each requested vocabulary size, the three inputs the service loads,
+in the formats it reads (word2vec binary, OpenLexicon TSV, pools JSON), without
+the frWac download or the real lexicon:
+
+    python -m app.fixtures --sizes 10000,100000,1000000 --dim 300 --output .cache/fixtures
+
+Each size goes to its own directory (`10k/`, `100k/`, `1m/`) along with an `env`
+file pointing WORD2VEC_CACHE_DIR, WORD2VEC_FILENAME, LEXICON_PATH and
+WORD_POOLS_PATH at it. Output is deterministic for a given seed.
+
+The vocabulary mimics the shape of the real data rather than its content:
+- syllable-built words, frequency-sorted, short and frequent first;
+- noun, adjective and verb lemmas, plus plural and conjugated forms, which
+  guesses get normalized to;
+- a tail of rare words that the lexicon frequency filter drops;
+- clustered vectors, so that secrets have close neighbors and pass the room
+  creation threshold like real pool words do;
+- inflected forms that sit next to their lemma.
+"""
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CONSONANTS = "bcdfglmnprstv"
+VOWELS = ("a", "e", "i", "o", "u", "é", "è", "ou")
+SYLLABLES = tuple(consonant + vowel for consonant in CONSONANTS for vowel in VOWELS)
+
+LEXICON_COLUMNS = (
+    "ortho",
+    "Lexique3__freqfilms2",
+    "Lexique3__cgram",
+    "Lexique3__cgramortho",
+    "Lexique3__islem",
+    "Lexique3__lemme",
+)
+VERB_ENDINGS = ("ons", "ez", "ait")
+
+# Share of stems per kind; rare words stay in the model but fail the lexicon frequency filter
+KIND_WEIGHTS = {"noun": 0.55, "adjective": 0.15, "verb": 0.15, "rare": 0.15}
+PLURAL_RATE = 0.5
+# Stems per vector cluster, and cosine targets within a cluster / between a lemma and its forms
+CLUSTER_SIZE = 40
+CLUSTER_COSINE = 0.7
+FORM_COSINE = 0.9
+POOL_SIZE = 500
+CHUNK_STEMS = 10000
+
+
+def size_label(words: int) -> str:
+    if words >= 1_000_000 and words % 1_000_000 == 0:
+        return f"{words // 1_000_000}m"
+    if words >= 1000 and words % 1000 == 0:
+        return f"{words // 1000}k"
+    return str(words)
+
+
+def parse_sizes(value: str) -> list[int]:
+    """Parse "10k,100k,1m" or "10000,100000" into word counts."""
+    sizes = []
+    for item in value.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        multiplier = {"k": 1000, "m": 1_000_000}.get(item[-1], 1)
+        sizes.append(int(float(item.rstrip("km")) * multiplier))
+    return sizes
+
+
+def _stems(rng: np.random.Generator) -> Iterator[str]:
+    """Unique words of 2 syllables, then 3, 4 and 5, in a seeded but stable order."""
+    syllables = [SYLLABLES[i] for i in rng.permutation(len(SYLLABLES))]
+    count = len(syllables)
+    for length in (2, 3, 4, 5):
+        for number in range(count ** length):
+            parts = []
+            for _ in range(length):
+                number, digit = divmod(number, count)
+                parts.append(syllables[digit])
+            yield "".join(parts)
+
+
+def _entries(stem: str, kind: str, plural: bool) -> list[tuple[str, str, bool, str]]:
+    """Vocabulary entries of one stem as (word, cgram, is_lemma, lemma), lemma first."""
+    if kind == "verb":
+        infinitive = stem + "er"
+        return [(infinitive, "VER", True, infinitive)] + [
+            (stem + ending, "VER", False, infinitive) for ending in VERB_ENDINGS
+        ]
+    if kind == "adjective":
+        return [(stem, "ADJ", True, stem)]
+    if kind == "noun" and plural:
+        return [(stem, "NOM", True, stem), (stem + "s", "NOM", False, stem)]
+    # Nouns without plural, and rare words (kept as nouns below the frequency cutoff)
+    return [(stem, "NOM", True, stem)]
+
+
+def _noise_scale(cosine: float, dim: int) -> float:
+    # cos(u + e1, u + e2) ~ 1 / (1 + sigma^2 * dim) for a unit u and Gaussian noise
+    return float(np.sqrt((1 / cosine - 1) / dim))
+
+
+class FixtureWriter:
+    def __init__(self, output: Path, words: int, dim: int, seed: int, pool_size: int):
+        self.output = output
+        self.words = words
+        self.dim = dim
+        self.seed = seed
+        self.pool_size = pool_size
+
+    def _frequency(self, position: int, kind: str) -> float:
+        if kind == "rare":
+            return 0.001
+        # Zipf-like, staying above the 0.01 lexicon cutoff for the whole vocabulary
+        return round(max(50000.0 / (position + 1), 0.02), 4)
+
+    def write(self) -> dict:
+        started = time.perf_counter()
+        self.output.mkdir(parents=True, exist_ok=True)
+        rng = np.random.default_rng(self.seed)
+        kinds = list(KIND_WEIGHTS)
+        weights = np.array([KIND_WEIGHTS[kind] for kind in kinds])
+
+        clusters = max(1, self.words // (CLUSTER_SIZE * 2))
+        centroids = rng.standard_normal((clusters, self.dim)).astype(np.float32)
+        centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
+        cluster_sigma = _noise_scale(CLUSTER_COSINE, self.dim)
+        # Forms deviate from their lemma by about the lemma's own norm times this
+        form_sigma = _noise_scale(FORM_COSINE, self.dim)
+
+        stems = _stems(np.random.default_rng(self.seed))
+        nouns: list[str] = []
+        written = 0
+        model_path = self.output / "model.bin"
+        with open(model_path, "wb") as model_file, open(
+            self.output / "OpenLexicon.tsv", "w", encoding="utf-8", newline=""
+        ) as lexicon_file:
+            model_file.write(f"{self.words} {self.dim}\n".encode("utf-8"))
+            lexicon_file.write("\t".join(LEXICON_COLUMNS) + "\n")
+
+            while written < self.words:
+                stem_kinds = rng.choice(len(kinds), size=CHUNK_STEMS, p=weights)
+                plurals = rng.random(CHUNK_STEMS) < PLURAL_RATE
+                stem_clusters = rng.integers(0, clusters, size=CHUNK_STEMS)
+                lemma_vectors = centroids[stem_clusters] + rng.standard_normal(
+                    (CHUNK_STEMS, self.dim), dtype=np.float32
+                ) * cluster_sigma
+
+                words: list[str] = []
+                vectors: list[np.ndarray] = []
+                for row in range(CHUNK_STEMS):
+                    if written + len(words) >= self.words:
+                        break
+                    kind = kinds[stem_kinds[row]]
+                    entries = _entries(next(stems), kind, bool(plurals[row]))
+                    entries = entries[: self.words - written - len(words)]
+                    lemma_vector = lemma_vectors[row]
+                    for word, cgram, is_lemma, lemma in entries:
+                        position = written + len(words)
+                        if is_lemma:
+                            vector = lemma_vector
+                        else:
+                            vector = lemma_vector + rng.standard_normal(self.dim, dtype=np.float32) * (
+                                form_sigma * float(np.linalg.norm(lemma_vector))
+                            )
+                        words.append(word)
+                        vectors.append(vector)
+                        lexicon_file.write("\t".join((
+                            word,
+                            str(self._frequency(position, kind)),
+                            cgram,
+                            cgram,
+                            "1" if is_lemma else "0",
+                            lemma,
+                        )) + "\n")
+                        if is_lemma and kind == "noun":
+                            nouns.append(word)
+
+                block = np.asarray(vectors, dtype="<f4")
+                for word, vector in zip(words, block):
+                    model_file.write(word.encode("utf-8") + b" " + vector.tobytes() + b"\n")
+                written += len(words)
+                logger.info(f"{self.output.name}: {written}/{self.words} words")
+
+        pools = self._pools(nouns)
+        with open(self.output / "word_pools.json", "w", encoding="utf-8") as f:
+            json.dump(pools, f, ensure_ascii=False, indent=2)
+
+        env = {
+            "WORD2VEC_CACHE_DIR": str(self.output.resolve()),
+            "WORD2VEC_FILENAME": model_path.name,
+            "LEXICON_PATH": str((self.output / "OpenLexicon.tsv").resolve()),
+            "WORD_POOLS_PATH": str((self.output / "word_pools.json").resolve()),
+        }
+        with open(self.output / "env", "w", encoding="utf-8") as f:
+            f.writelines(f"{key}={value}\n" for key, value in env.items())
+
+        elapsed = time.perf_counter() - started
+        return {
+            "words": self.words,
+            "dim": self.dim,
+            "model_bytes": model_path.stat().st_size,
+            "nouns": len(nouns),
+            "pools": {key: len(value) for key, value in pools.items()},
+            "elapsed_seconds": round(elapsed, 1),
+        }
+
+    def _pools(self, nouns: list[str]) -> dict[str, list[str]]:
+        """Most frequent nouns are easy, then medium, then hard (same split as the real pools)."""
+        size = min(self.pool_size, len(nouns) // 3)
+        return {
+            "easy": nouns[:size],
+            "medium": nouns[size:2 * size],
+            "hard": nouns[2 * size:3 * size],
+        }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic model, lexicon and pools fixtures.")
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("10k"), help="e.g. 10k,100k,1m")
+    parser.add_argument("--dim", type=int, default=700, help="Vector dimension (frWac: 700)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE, help="Words per difficulty pool")
+    parser.add_argument("--output", type=Path, default=Path(".cache/fixtures"))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    for words in args.sizes:
+        target = args.output / size_label(words)
+        report = FixtureWriter(target, words, args.dim, args.seed, args.pool_size).write()
+        logger.info(f"Wrote {target}: {report}")
+
+
+if __name__ == "__main__":
+    main()
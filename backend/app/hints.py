@@ -0,0 +1,68 @@
+"""
+Hint ladder: a few words of the secret's top 1000 at fixed rank bands.
+
+Computed once at room creation from the top-1000 list and stored with the room
+secret, so serving a hint is a lookup, never a model call.
+"""
+
+from typing import Optional
+
+from .embeddings import normalize_word, score_from_similarity, strip_accents
+
+# How far from the target rank to look for a word that doesn't give the secret away
+MAX_RANK_DRIFT = 25
+# Words sharing this many leading letters with the secret are considered the same family
+FAMILY_PREFIX = 4
+
+
+def parse_hint_ranks(value: str) -> list[int]:
+    """Parse "500,800,950" into sorted ranks within 1-999 (easiest hint last)."""
+    ranks = {int(item) for item in value.split(",") if item.strip()}
+    return sorted(rank for rank in ranks if 1 <= rank <= 999)
+
+
+def _gives_away(word: str, secret_plain: str) -> bool:
+    plain = strip_accents(normalize_word(word))
+    if secret_plain in plain or plain in secret_plain:
+        return True
+    return plain[:FAMILY_PREFIX] == secret_plain[:FAMILY_PREFIX]
+
+
+def _pick_position(top_1000: list[dict], target: int, secret_plain: str, used: set[int]) -> Optional[int]:
+    """Closest usable position to `target`, trying farther neighbors first on ties."""
+    for drift in range(MAX_RANK_DRIFT + 1):
+        for position in (target + drift, target - drift):
+            if position in used or not 0 <= position < len(top_1000):
+                continue
+            if not _gives_away(top_1000[position]["word"], secret_plain):
+                return position
+    return None
+
+
+def build_hint_ladder(
+    secret_word: str,
+    top_1000: list[dict],
+    max_similarity: float,
+    min_similarity: float,
+    ranks: list[int],
+) -> list[dict]:
+    """One hint per rank band, each {level, rank, word, temperature}; level 1 is the vaguest."""
+    secret_plain = strip_accents(normalize_word(secret_word))
+    hints: list[dict] = []
+    used: set[int] = set()
+    for rank in ranks:
+        # Same scale as get_rank: position 0 is rank 999
+        position = _pick_position(top_1000, 999 - rank, secret_plain, used)
+        if position is None:
+            continue
+        used.add(position)
+        entry = top_1000[position]
+        actual_rank = max(1, 999 - position)
+        _, temperature = score_from_similarity(entry["similarity"], max_similarity, min_similarity, actual_rank)
+        hints.append({
+            "level": len(hints) + 1,
+            "rank": actual_rank,
+            "word": entry["word"],
+            "temperature": temperature,
+        })
+    return hints
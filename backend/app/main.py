@@ -1,12 +1,16 @@
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from .config import get_settings
-from .routes import guesses, rooms
+from .routes import admin, guesses, health, room_socket, rooms, status
+from .services.affinity import RoomAffinityMiddleware
+from .services.warmup import get_warmup
 
 # Configure logging
 logging.basicConfig(
@@ -17,12 +21,27 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def ensure_word_pools_available() -> None:
-    from .embeddings import load_word_pools
+async def run_retention_periodically(interval_minutes: float) -> None:
+    from .services.retention import run_retention
 
-    pools = load_word_pools()
-    if not pools:
-        raise RuntimeError("word_pools.json missing or empty in backend/data")
+    while True:
+        await asyncio.sleep(interval_minutes * 60)
+        try:
+            await asyncio.to_thread(run_retention)
+        except Exception as e:
+            logger.error(f"Retention run failed: {e}")
+
+
+async def flush_room_broadcasts_periodically(interval_ms: int) -> None:
+    from .services.room_broadcast import get_room_broadcaster
+
+    broadcaster = get_room_broadcaster()
+    while True:
+        await asyncio.sleep(interval_ms / 1000)
+        try:
+            await asyncio.to_thread(broadcaster.flush)
+        except Exception as e:
+            logger.error(f"Room broadcast flush failed: {e}")
 
 
 @asynccontextmanager
@@ -30,22 +49,38 @@ async def lifespan(app: FastAPI):
     """Application lifespan - load models on startup."""
     logger.info("Starting jabruuuhtix API...")
 
-    logger.info("Validating word pools...")
-    ensure_word_pools_available()
-    logger.info("Word pools validated.")
-
-    # Preload the Word2Vec model on startup
-    try:
-        from .embeddings import load_model
-        logger.info("Preloading Word2Vec model...")
-        load_model()
-        logger.info("Word2Vec model loaded successfully!")
-    except Exception as e:
-        logger.error(f"Failed to load Word2Vec model: {e}")
-        # Don't fail startup, model will be loaded on first request
+    tracemalloc_frames = get_settings().tracemalloc_frames
+    if tracemalloc_frames > 0 and not get_settings().diagnostics_enabled:
+        # Tracing slows every allocation down: never pay for it without the endpoints
+        logger.warning("TRACEMALLOC_FRAMES ignored: DIAGNOSTICS_ENABLED is false")
+    elif tracemalloc_frames > 0:
+        # Before loading anything, so the model and lexicon allocations are traced too
+        from .services.diagnostics import start_tracing
+        start_tracing(tracemalloc_frames)
+        logger.info(f"tracemalloc started ({tracemalloc_frames} frames)")
+
+    # Load lexicon, model, pools and indexes in the background: /health/live answers
+    # right away, /health/ready only once scoring needs no further loading
+    warmup_task = asyncio.create_task(asyncio.to_thread(get_warmup().run))
+
+    # One coalesced realtime message per active room and per tick
+    broadcast_task = asyncio.create_task(
+        flush_room_broadcasts_periodically(max(get_settings().realtime_batch_interval_ms, 50))
+    )
+
+    retention_task = None
+    retention_interval = get_settings().retention_interval_minutes
+    if retention_interval > 0:
+        logger.info(f"Archiving finished/idle rooms every {retention_interval} minutes")
+        retention_task = asyncio.create_task(run_retention_periodically(retention_interval))
     
     yield
     
+    broadcast_task.cancel()
+    if retention_task:
+        retention_task.cancel()
+    if not warmup_task.done():
+        logger.info("Shutting down during warmup; loading threads finish in the background")
     logger.info("Shutting down jabruuuhtix API...")
 
 
@@ -68,14 +103,30 @@ else:
 
 logger.info(f"CORS configured with origins: {origins}")
 
+# Added before CORS so redirects and affinity headers still get CORS headers
+app.add_middleware(RoomAffinityMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True if origins != ["*"] else False,  # Can't use credentials with "*"
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Room-Node", "X-Room-Node-Url", "X-Served-By"],
 )
 
+@app.exception_handler(guesses.GuessRejected)
+async def guess_rejected_handler(request: Request, exc: guesses.GuessRejected):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail, "suggestions": exc.suggestions},
+    )
+
+
 # Include routers
 app.include_router(rooms.router)
+app.include_router(room_socket.router)
 app.include_router(guesses.router)
+app.include_router(status.router)
+app.include_router(admin.router)
+app.include_router(health.router)
@@ -0,0 +1,100 @@
+import secrets
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from ..config import get_settings
+from ..services import diagnostics
+from ..services.model_reload import reload_status, start_reload
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+def require_admin(x_admin_token: str = Header(default="")) -> None:
+    """Reject requests without the configured ADMIN_TOKEN (all requests if unset)."""
+    expected = get_settings().admin_token
+    if not expected or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+def require_diagnostics() -> None:
+    """Diagnostics are opt-in (DIAGNOSTICS_ENABLED); hide them entirely otherwise."""
+    if not get_settings().diagnostics_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+class ReloadRequest(BaseModel):
+    modelUrl: Optional[str] = None
+    modelFilename: Optional[str] = None
+    lexiconPath: Optional[str] = None
+    wordPoolsPath: Optional[str] = None
+
+
+@router.post("/reload", status_code=202, dependencies=[Depends(require_admin)])
+async def reload_resources(request: ReloadRequest):
+    """
+    Load a new model/lexicon/pools version in the background and swap it in.
+
+    Only the worker handling this request reloads; with several workers, call it on each.
+    """
+    try:
+        started = start_reload({
+            "model_url": request.modelUrl,
+            "model_filename": request.modelFilename,
+            "lexicon_path": request.lexiconPath,
+            "word_pools_path": request.wordPoolsPath,
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not started:
+        raise HTTPException(status_code=409, detail="A reload is already in progress")
+    return reload_status()
+
+
+@router.get("/reload", dependencies=[Depends(require_admin)])
+async def get_reload_status():
+    """State of the last reload, the active version and the versions kept in memory."""
+    return reload_status()
+
+
+class TracingRequest(BaseModel):
+    frames: int = Field(1, ge=1, le=64)
+
+
+diagnostics_dependencies = [Depends(require_admin), Depends(require_diagnostics)]
+
+
+@router.get("/diagnostics/memory", dependencies=diagnostics_dependencies)
+def get_memory_report():
+    """RSS, sizes of the model/lexicon/pools of each loaded version and of room caches (bytes)."""
+    return diagnostics.memory_report()
+
+
+@router.post("/diagnostics/tracing", dependencies=diagnostics_dependencies)
+def start_tracing(request: TracingRequest):
+    """Start tracemalloc; only allocations made from now on are traced."""
+    diagnostics.start_tracing(request.frames)
+    return diagnostics.memory_report()["tracemalloc"]
+
+
+@router.delete("/diagnostics/tracing", dependencies=diagnostics_dependencies)
+def stop_tracing():
+    """Stop tracemalloc and drop its traces (tracing costs memory and CPU)."""
+    diagnostics.stop_tracing()
+    return diagnostics.memory_report()["tracemalloc"]
+
+
+@router.get("/diagnostics/allocations", dependencies=diagnostics_dependencies)
+def get_top_allocations(
+    limit: int = Query(20, ge=1, le=200),
+    groupBy: Literal["lineno", "filename", "traceback"] = "lineno",
+):
+    """Top live allocations traced by tracemalloc."""
+    return {"allocations": diagnostics.top_allocations(limit, groupBy)}
+
+
+@router.get("/diagnostics/profiles", dependencies=diagnostics_dependencies)
+def get_allocation_profiles(label: Optional[str] = None):
+    """Allocation profiles of sampled submit_guess calls, oldest first."""
+    return {"profiles": diagnostics.recent_profiles(label)}
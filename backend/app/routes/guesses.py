@@ -1,21 +1,46 @@
+import logging
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from ..embeddings import (
     get_embedding,
+    get_resources,
+    compute_raw_similarity,
     compute_score_and_temperature,
+    current_resources,
+    exact_vocabulary_rank,
     get_rank,
+    get_rank_from_indices,
+    get_secret_embedding,
     is_allowed_guess,
     normalize_guess_word,
     normalize_word,
+    similarity_percentile,
+    use_resources,
+    vocabulary_rank,
 )
+from ..services.admission import get_guess_admission
+from ..services.diagnostics import profile_allocations
+from ..services.room_broadcast import get_room_broadcaster
+from ..services.room_hub import get_room_hub
+from ..services.room_summary import GUESS_COLUMNS, record_guess
 from ..services.supabase import get_supabase_client
+from ..suggestions import suggest_corrections
+from ..utils.cursor import after_filter, cursor_time, decode_cursor, encode_cursor, settled_cursor
+from ..utils.packing import decode_bytea, unpack_floats, unpack_top_words
 from ..utils.pgvector import parse_pgvector
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/guesses", tags=["guesses"])
 
+SECRET_COLUMNS = (
+    "secret_word,secret_word_index,max_similarity,min_similarity,"
+    "top_1000_packed,similarity_quantiles,vocabulary_size,model_version"
+)
+
 
 class SubmitGuessRequest(BaseModel):
     roomCode: str
@@ -31,23 +56,194 @@ class SubmitGuessResponse(BaseModel):
     score: int
     rank: Optional[int] = None  # 1-1000 (1000 = closest) or null if not in top 1000
     temperature: float = 0.0  # Temperature in °C
+    percentile: Optional[float] = None  # 0-100 over the whole allowed vocabulary
+    # 1 = the secret; exact inside the top 1000, interpolated (approximate) beyond it
+    vocabularyRank: Optional[int] = None
     createdAt: str
     revealedWord: Optional[str] = None
 
 
+class GuessRejected(HTTPException):
+    """400 for a word outside the dictionary; the body also lists spelling suggestions."""
+
+    def __init__(self, detail: str, word: str):
+        super().__init__(status_code=400, detail=detail)
+        # Only computed on rejection, so valid guesses pay nothing
+        try:
+            self.suggestions = suggest_corrections(word)
+        except Exception as e:
+            logger.error(f"Failed to compute suggestions for '{word}': {e}")
+            self.suggestions = []
+
+
+class GuessRow(BaseModel):
+    id: str
+    room_id: str
+    player_id: str
+    player_name: str
+    word: str
+    score: int
+    rank: Optional[int] = None
+    temperature: float = 0.0
+    created_at: str
+
+
+class GuessPageResponse(BaseModel):
+    guesses: list[GuessRow]
+    nextCursor: Optional[str] = None  # Cursor of the last returned guess (or the input cursor)
+    hasMore: bool = False
+
+
+@router.get("", response_model=GuessPageResponse)
+def list_guesses(
+    roomId: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=1000),
+    roomCode: Optional[str] = None,
+):
+    """
+    List guesses of a room created after a cursor, oldest first.
+
+    `roomCode` is not used for the query: it lets RoomAffinityMiddleware route the
+    request to the room's node.
+    """
+    supabase = get_supabase_client()
+
+    try:
+        after = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Keyset pagination on (created_at, id), served by idx_guesses_room_created_id
+    query = supabase.table("guesses").select(GUESS_COLUMNS).eq("room_id", roomId)
+    if after:
+        query = query.or_(after_filter(*after))
+
+    try:
+        result = query.order("created_at").order("id").limit(limit + 1).execute()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+    rows = result.data or []
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    # Hold the cursor back by the settle window so rows committing late are served by the
+    # next call (clients dedupe the overlap by id). A page that fits in the window still
+    # advances to its last row when more follow, or paging would never progress.
+    next_cursor = cursor
+    if rows:
+        last = rows[-1]
+        settled = settled_cursor(last["created_at"])
+        if after is None or cursor_time(decode_cursor(settled)[0]) > cursor_time(after[0]):
+            next_cursor = settled
+        elif has_more:
+            next_cursor = encode_cursor(last["created_at"], last["id"])
+
+    return GuessPageResponse(guesses=rows, nextCursor=next_cursor, hasMore=has_more)
+
+
+def _score_against_secret(
+    supabase,
+    room_id: str,
+    word: str,
+    secret: dict,
+    stale_version: bool,
+) -> tuple[int, Optional[int], float, Optional[float], Optional[int]]:
+    """Score a guess against a room secret: (score, rank, temperature, percentile, vocabularyRank)."""
+    secret_word = secret["secret_word"]
+    max_similarity = secret.get("max_similarity", 0.7)
+    min_similarity = secret.get("min_similarity", 0.1)
+
+    secret_embedding = get_secret_embedding(secret_word, secret.get("secret_word_index"))
+    top_1000_packed = secret.get("top_1000_packed")
+    top_indices = None
+    top_1000: list[dict] = []
+    if stale_version:
+        # The room's model version is no longer loaded: packed indices point into
+        # another vocabulary, so only score and percentile can be computed
+        logger.warning(f"Room {room_id} model version {secret.get('model_version')} not loaded")
+    elif top_1000_packed:
+        top_indices, _ = unpack_top_words(decode_bytea(top_1000_packed))
+    if secret_embedding is None or (not top_1000_packed and not stale_version):
+        # Rooms created before 007_compact_room_secrets.sql: pgvector text + JSON top 1000
+        legacy = (
+            supabase.table("room_secrets")
+            .select("secret_embedding,top_1000_words")
+            .eq("room_id", room_id)
+            .single()
+            .execute()
+        ).data or {}
+        if secret_embedding is None:
+            # pgvector returns format like "[0.1,0.2,...]" or "(0.1,0.2,...)"
+            secret_embedding = parse_pgvector(legacy.get("secret_embedding") or "")
+        top_1000 = legacy.get("top_1000_words") or []
+    
+    quantiles_packed = secret.get("similarity_quantiles")
+    quantiles = unpack_floats(decode_bytea(quantiles_packed)) if quantiles_packed else None
+    vocabulary_size = secret.get("vocabulary_size") or 0
+
+    percentile = None
+    vocab_rank = None
+
+    # Check if exact match (using consistent normalization)
+    if word == normalize_word(secret_word):
+        score = 100
+        rank = 1000  # Exact match = highest rank
+        temperature = 100.0
+        percentile = 100.0
+        vocab_rank = 1
+    else:
+        # Compute embedding and normalized score
+        try:
+            guess_embedding = get_embedding(word)
+            if top_indices is not None:
+                rank = get_rank_from_indices(word, top_indices)
+            else:
+                rank = get_rank(word, top_1000)
+            score, temperature = compute_score_and_temperature(
+                guess_embedding,
+                secret_embedding,
+                max_similarity,
+                min_similarity,
+                rank,
+            )
+            vocab_rank = exact_vocabulary_rank(rank)
+            if quantiles is not None:
+                # Rooms created before 009_similarity_quantiles.sql have no table
+                raw_similarity = compute_raw_similarity(guess_embedding, secret_embedding)
+                percentile = round(similarity_percentile(raw_similarity, quantiles), 2)
+                if vocab_rank is None:
+                    vocab_rank = vocabulary_rank(percentile, vocabulary_size)
+                if rank is None:
+                    top_count = len(top_indices) if top_indices is not None else len(top_1000)
+                    # Outside the top 1000 means behind all of it, whatever the interpolation says
+                    vocab_rank = max(vocab_rank, top_count + 2)
+        except KeyError:
+            raise GuessRejected(f"Le mot '{word}' n'existe pas dans le dictionnaire", word)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to compute score: {str(e)}")
+
+    return score, rank, temperature, percentile, vocab_rank
+
+
 @router.post("", response_model=SubmitGuessResponse)
-async def submit_guess(request: SubmitGuessRequest):
+def submit_guess(request: SubmitGuessRequest):
     """Submit a word guess and get similarity score."""
+    # Shed load before any database read or scoring work
+    with get_guess_admission().admit(request.roomCode, request.playerId):
+        with profile_allocations("submit_guess"):
+            return _score_and_store_guess(request)
+
+
+def _score_and_store_guess(request: SubmitGuessRequest) -> SubmitGuessResponse:
     supabase = get_supabase_client()
     
     # Normalize word (lemmatize conjugated verbs when possible)
     word = normalize_guess_word(request.word)
 
     if not is_allowed_guess(word):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Le mot '{word}' n'est pas autorisé",
-        )
+        raise GuessRejected(f"Le mot '{word}' n'est pas autorisé", word)
     
     # Find room by code
     room_result = supabase.table("rooms").select("*").eq("code", request.roomCode).single().execute()
@@ -63,47 +259,29 @@ async def submit_guess(request: SubmitGuessRequest):
     if room.get("revealed_word"):
         raise HTTPException(status_code=400, detail="Game already finished")
     
-    # Get secret word embedding
-    secret_result = supabase.table("room_secrets").select("*").eq("room_id", room_id).single().execute()
+    # Get secret word data (compact columns only; legacy rows fall back below)
+    secret_result = (
+        supabase.table("room_secrets")
+        .select(SECRET_COLUMNS)
+        .eq("room_id", room_id)
+        .single()
+        .execute()
+    )
     
     if not secret_result.data:
         raise HTTPException(status_code=500, detail="Room secret not found")
     
     secret = secret_result.data
     secret_word = secret["secret_word"]
-    secret_embedding_raw = secret["secret_embedding"]
-    max_similarity = secret.get("max_similarity", 0.7)
-    min_similarity = secret.get("min_similarity", 0.1)
-    top_1000 = secret.get("top_1000_words") or []
-    
-    # Parse pgvector string to list of floats
-    # pgvector returns format like "[0.1,0.2,...]" or "(0.1,0.2,...)"
-    secret_embedding = parse_pgvector(secret_embedding_raw)
-    
-    # Check if exact match (using consistent normalization)
-    if word == normalize_word(secret_word):
-        score = 100
-        rank = 1000  # Exact match = highest rank
-        temperature = 100.0
-    else:
-        # Compute embedding and normalized score
-        try:
-            guess_embedding = get_embedding(word)
-            rank = get_rank(word, top_1000)
-            score, temperature = compute_score_and_temperature(
-                guess_embedding,
-                secret_embedding,
-                max_similarity,
-                min_similarity,
-                rank,
-            )
-        except KeyError:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Le mot '{word}' n'existe pas dans le dictionnaire"
-            )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to compute score: {str(e)}")
+
+    # Score with the model/lexicon version the room was created with, if still loaded
+    model_version = secret.get("model_version")
+    resources = get_resources(model_version)
+    stale_version = bool(model_version) and resources is None and model_version != current_resources().version
+    with use_resources(resources or current_resources()):
+        score, rank, temperature, percentile, vocab_rank = _score_against_secret(
+            supabase, room_id, word, secret, stale_version
+        )
     
     # Insert guess
     try:
@@ -121,6 +299,11 @@ async def submit_guess(request: SubmitGuessRequest):
             raise HTTPException(status_code=500, detail="Failed to save guess")
         
         guess_data = guess_result.data[0]
+        record_guess(guess_data)
+        guess_row = GuessRow(**guess_data).model_dump()
+        # Push to this worker's room sockets right away; other clients get the next batch
+        get_room_hub().publish(room_id, {"type": "guess", "guess": guess_row})
+        get_room_broadcaster().add_guess(guess_row)
         
         # If score is 100, reveal the word
         revealed_word = None
@@ -131,6 +314,7 @@ async def submit_guess(request: SubmitGuessRequest):
                     "revealed_word": secret_word,
                     "status": "finished"
                 }).eq("id", room_id).execute()
+                get_room_broadcaster().reveal(room_id, secret_word)
         
         return SubmitGuessResponse(
             guessId=guess_data["id"],
@@ -139,6 +323,8 @@ async def submit_guess(request: SubmitGuessRequest):
             score=score,
             rank=rank,
             temperature=temperature,
+            percentile=percentile,
+            vocabularyRank=vocab_rank,
             createdAt=guess_data["created_at"],
             revealedWord=revealed_word
         )
@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from ..embeddings import current_resources
+from ..services.warmup import get_warmup
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live")
+async def live():
+    """The process is up and serving HTTP (warmup may still be running)."""
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def ready():
+    """200 once lexicon, model, word pools and scoring indexes are loaded, else 503."""
+    status = get_warmup().status()
+    resources = current_resources()
+    status["version"] = resources.version
+    # After a hot reload the active version must be fully loaded too
+    status["ready"] = status["ready"] and resources.is_loaded
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from ..config import get_settings
+from ..services.room_hub import get_room_hub
+from ..services.supabase import get_supabase_client
+from .guesses import GuessRejected, SubmitGuessRequest, submit_guess
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/rooms", tags=["rooms"])
+
+# Close codes (4000-4999 are reserved for applications)
+CLOSE_DISABLED = 4403
+CLOSE_ROOM_NOT_FOUND = 4404
+CLOSE_INVALID_PLAYER = 4422
+
+
+def _find_room_id(code: str) -> Optional[str]:
+    supabase = get_supabase_client()
+    result = supabase.table("rooms").select("id").eq("code", code).limit(1).execute()
+    return result.data[0]["id"] if result.data else None
+
+
+def _error_message(request_id: Optional[str], status: int, detail: str, headers: Optional[dict] = None) -> dict:
+    message = {"type": "error", "requestId": request_id, "status": status, "detail": detail}
+    retry_after = (headers or {}).get("Retry-After")
+    if retry_after:
+        message["retryAfter"] = int(retry_after)
+    return message
+
+
+@router.websocket("/{code}/ws")
+async def room_socket(websocket: WebSocket, code: str, playerId: str = "", playerName: str = ""):
+    """
+    Persistent guess channel for one player in one room.
+
+    Client messages:
+        {"type": "guess", "word": "...", "requestId": "..."}
+        {"type": "ping"}
+
+    Server messages:
+        {"type": "guessResult", "requestId": "...", ...SubmitGuessResponse}
+        {"type": "guess", "guess": {...guess row}}  (every guess of the room, including the sender's)
+        {"type": "error", "requestId": "...", "status": 400, "detail": "...", "retryAfter": 2}
+        {"type": "pong"}
+
+    Guesses go through the same admission, scoring and storage as POST /api/guesses.
+    Fan-out only reaches sockets held by this worker; guesses submitted through other
+    workers arrive with the coalesced realtime `batch` (services/room_broadcast.py).
+    """
+    await websocket.accept()
+    # Codes are stored uppercase; match the other room routes
+    code = code.upper()
+
+    if not get_settings().room_socket_enabled:
+        await websocket.close(code=CLOSE_DISABLED)
+        return
+    if not playerId or not playerName or len(playerName) > 32:
+        await websocket.close(code=CLOSE_INVALID_PLAYER)
+        return
+
+    room_id = await asyncio.to_thread(_find_room_id, code)
+    if room_id is None:
+        await websocket.close(code=CLOSE_ROOM_NOT_FOUND)
+        return
+
+    hub = get_room_hub()
+    connection = hub.connect(websocket, room_id, playerId)
+    writer = asyncio.create_task(connection.run_writer())
+    logger.info(f"Player {playerId} connected to room {code} socket")
+
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(message, dict):
+                continue
+
+            message_type = message.get("type")
+            if message_type == "ping":
+                hub.send(connection, {"type": "pong"})
+                continue
+            if message_type != "guess":
+                continue
+
+            request_id = message.get("requestId")
+            try:
+                request = SubmitGuessRequest(
+                    roomCode=code,
+                    playerId=playerId,
+                    playerName=playerName,
+                    word=str(message.get("word", "")),
+                )
+                # Scoring and Supabase calls are blocking: keep them off the event loop
+                response = await asyncio.to_thread(submit_guess, request)
+            except HTTPException as e:
+                error = _error_message(request_id, e.status_code, str(e.detail), e.headers)
+                if isinstance(e, GuessRejected):
+                    error["suggestions"] = e.suggestions
+                hub.send(connection, error)
+                continue
+            except ValidationError:
+                hub.send(connection, _error_message(request_id, 422, "Proposition invalide"))
+                continue
+            except Exception as e:
+                logger.error(f"Room {code} socket guess failed for player {playerId}: {e}")
+                hub.send(connection, _error_message(request_id, 500, "Erreur serveur"))
+                continue
+
+            hub.send(connection, {"type": "guessResult", "requestId": request_id, **response.model_dump()})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Room {code} socket error for player {playerId}: {e}")
+    finally:
+        hub.disconnect(connection)
+        writer.cancel()
+        logger.info(f"Player {playerId} disconnected from room {code} socket")
@@ -1,17 +1,26 @@
 import logging
 import random
 import string
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from .guesses import GuessRow
+from ..config import get_settings
+from ..hints import build_hint_ladder, parse_hint_ranks
+from ..services.affinity import generate_local_room_code
+from ..services.room_summary import fetch_guesses, get_room_summary
 from ..services.supabase import get_supabase_client
+from ..utils.packing import encode_bytea, pack_floats
 from ..embeddings import (
-    get_embedding,
-    find_min_similarity,
-    compute_top_1000,
+    compute_secret_profile,
+    current_resources,
+    get_word_index,
     load_word_pools,
+    pack_top_1000,
+    use_resources,
     is_word_in_vocabulary,
     is_lemma_form,
     normalize_guess_word,
@@ -21,6 +30,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/rooms", tags=["rooms"])
 
+# Secret draws from calibrated pools: the first should pass, the rest cover pools that
+# drifted from the loaded version in ways the stamp can't see
+CALIBRATED_POOL_ATTEMPTS = 5
+
 
 class CreateRoomRequest(BaseModel):
     playerName: str = Field(..., max_length=32)
@@ -40,6 +53,31 @@ class CreateRoomResponse(BaseModel):
     room: RoomResponse
 
 
+class PlayerSummary(BaseModel):
+    playerId: str
+    playerName: str
+    bestScore: int
+    guessCount: int
+
+
+class RoomSummaryResponse(BaseModel):
+    room: RoomResponse
+    guessCount: int
+    topGuesses: list[GuessRow]
+    players: list[PlayerSummary]
+    playerGuesses: list[GuessRow] = []
+    recentGuesses: list[GuessRow] = []  # Guesses of the last seconds, already in the counts
+    cursor: Optional[str] = None  # Pass to GET /api/guesses to fetch guesses after this snapshot
+
+
+class HintResponse(BaseModel):
+    level: int
+    levels: int  # Number of hints available in this room
+    rank: int  # Same scale as guesses: 999 = closest neighbor
+    word: str
+    temperature: float
+
+
 def generate_room_code(length: int = 6) -> str:
     """Generate a random alphanumeric room code."""
     return "".join(random.choices(string.ascii_uppercase + string.digits, k=length))
@@ -78,64 +116,97 @@ def get_random_secret_word(max_attempts: int = 25) -> tuple[str, str]:
     raise HTTPException(status_code=500, detail="No secret word candidates available")
 
 
-@router.post("", response_model=CreateRoomResponse)
-async def create_room(request: CreateRoomRequest):
-    """Create a new game room with a secret word."""
-    supabase = get_supabase_client()
-    
-    # Generate room code and secret word
-    room_code = generate_room_code()
+def build_room_secret() -> tuple[str, dict]:
+    """Pick a secret word and compute everything stored in room_secrets (except room_id)."""
     min_max_similarity = 0.6
-    max_attempts = 25
+    # Calibrated pools only hold words that clear the threshold with this model and
+    # lexicon, so the first pick should pass; a few retries stay as a safety net.
+    # Hand-curated pools need the full threshold retries.
+    calibrated = current_resources().word_pools_calibrated
+    max_attempts = CALIBRATED_POOL_ATTEMPTS if calibrated else 25
     secret_word = ""
     difficulty = "medium"
-    secret_embedding: list[float] = []
     max_similarity = 0.0
     min_similarity = 0.1
     top_1000: list[dict] = []
+    profile: dict = {}
 
     for _ in range(max_attempts):
         candidate, candidate_difficulty = get_random_secret_word()
-        try:
-            candidate_embedding = get_embedding(candidate)
-        except Exception as e:
-            logger.warning(f"Failed to compute embedding for '{candidate}': {e}")
+        if get_word_index(candidate) is None:
+            logger.warning(f"Secret candidate '{candidate}' not in vocabulary")
             continue
 
         try:
-            candidate_top_1000 = compute_top_1000(candidate)
+            # One vectorized pass: top 1000, exact min similarity and quantile table
+            candidate_profile = compute_secret_profile(candidate)
+            candidate_top_1000 = candidate_profile["top_1000"] if candidate_profile else []
             if not candidate_top_1000:
                 logger.warning(f"No top-1000 words for '{candidate}', retrying")
                 continue
             candidate_max_similarity = float(candidate_top_1000[0]["similarity"])
             if candidate_max_similarity < min_max_similarity:
-                logger.info(
+                log = logger.warning if calibrated else logger.info
+                log(
                     f"Secret '{candidate}' below similarity threshold "
                     f"({candidate_max_similarity:.4f} < {min_max_similarity:.2f}); retrying"
                 )
                 continue
-            candidate_min_similarity = find_min_similarity(candidate)
+            candidate_min_similarity = candidate_profile["min_similarity"]
         except Exception as e:
             logger.warning(f"Failed to compute similarities for '{candidate}': {e}")
             continue
 
         secret_word = candidate
         difficulty = candidate_difficulty
-        secret_embedding = candidate_embedding
         max_similarity = candidate_max_similarity
         min_similarity = candidate_min_similarity
         top_1000 = candidate_top_1000
+        profile = candidate_profile
         break
 
     if not secret_word:
         raise HTTPException(status_code=500, detail="No suitable secret word found")
-    mode = request.mode
 
     logger.info(
-        f"Room created with secret '{secret_word}', difficulty: {difficulty}, "
+        f"Secret chosen: '{secret_word}', difficulty: {difficulty}, "
         f"max_similarity: {max_similarity:.4f}, min_similarity: {min_similarity:.4f}, "
         f"top_1000: {len(top_1000)} words"
     )
+
+    # The embedding is stored as its vocabulary index and the top 1000 as packed
+    # indices + float16 similarities (see utils/packing.py), not as JSON/pgvector text.
+    return difficulty, {
+        "secret_word": secret_word,
+        "secret_word_index": get_word_index(secret_word),
+        "max_similarity": max_similarity,
+        "min_similarity": min_similarity,
+        "top_1000_packed": encode_bytea(pack_top_1000(top_1000)),
+        "similarity_quantiles": encode_bytea(pack_floats(profile["quantiles"])),
+        "vocabulary_size": profile["vocabulary_size"],
+        "model_version": current_resources().version,
+        # Served by GET /api/rooms/{code}/hints/{level} without touching the model
+        "hints": build_hint_ladder(
+            secret_word,
+            top_1000,
+            max_similarity,
+            min_similarity,
+            parse_hint_ranks(get_settings().hint_ranks),
+        ),
+    }
+
+
+@router.post("", response_model=CreateRoomResponse)
+async def create_room(request: CreateRoomRequest):
+    """Create a new game room with a secret word."""
+    supabase = get_supabase_client()
+    
+    # Generate room code (owned by this node when room affinity is on) and secret word
+    room_code = generate_local_room_code(generate_room_code)
+    # Pin one resources version for the whole secret computation (hot reload safe)
+    with use_resources(current_resources()):
+        difficulty, secret_fields = build_room_secret()
+    mode = request.mode
     
     # Create room in database
     try:
@@ -156,11 +227,7 @@ async def create_room(request: CreateRoomRequest):
         # Insert room secret with similarities and top 1000
         room_secret_result = supabase.table("room_secrets").insert({
             "room_id": room_id,
-            "secret_word": secret_word,
-            "secret_embedding": secret_embedding,
-            "max_similarity": max_similarity,
-            "min_similarity": min_similarity,
-            "top_1000_words": top_1000
+            **secret_fields,
         }).execute()
         
         if not room_secret_result.data:
@@ -181,3 +248,82 @@ async def create_room(request: CreateRoomRequest):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+@router.get("/{code}/summary", response_model=RoomSummaryResponse)
+def get_room_summary_by_code(
+    code: str,
+    limit: int = Query(100, ge=1, le=1000),
+    playerId: Optional[str] = None,
+):
+    """
+    Compact room snapshot for joining: top guesses and per-player stats.
+
+    Plain def: the Supabase calls (and a cold summary build) block, so FastAPI runs
+    this in its threadpool instead of on the event loop.
+    """
+    supabase = get_supabase_client()
+
+    room_result = supabase.table("rooms").select("*").eq("code", code.upper()).single().execute()
+
+    if not room_result.data:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    room_data = room_result.data
+    summary = get_room_summary(room_data["id"]).snapshot(limit)
+
+    # The requesting player's own history is needed for blocked words and the PVP table
+    player_guesses = fetch_guesses(room_data["id"], player_id=playerId) if playerId else []
+
+    return RoomSummaryResponse(
+        room=RoomResponse(
+            id=room_data["id"],
+            code=room_data["code"],
+            status=room_data["status"],
+            revealed_word=room_data.get("revealed_word"),
+            mode=room_data["mode"],
+            created_at=room_data["created_at"],
+        ),
+        guessCount=summary["guessCount"],
+        topGuesses=summary["topGuesses"],
+        players=summary["players"],
+        playerGuesses=player_guesses,
+        recentGuesses=summary["recentGuesses"],
+        cursor=summary["cursor"],
+    )
+
+
+@lru_cache(maxsize=1024)
+def _load_room_hints(room_id: str) -> tuple[dict, ...]:
+    """
+    Hint ladder of a room (immutable once created, so cached; misses raise and aren't).
+
+    Keyed by room id: codes are freed by archival and reused by new rooms.
+    """
+    supabase = get_supabase_client()
+    secret_result = (
+        supabase.table("room_secrets")
+        .select("hints")
+        .eq("room_id", room_id)
+        .limit(1)
+        .execute()
+    )
+    hints = secret_result.data[0].get("hints") if secret_result.data else None
+    if not hints:
+        # Rooms created before 011_room_hints.sql
+        raise HTTPException(status_code=404, detail="Aucun indice pour ce salon")
+    return tuple(hints)
+
+
+@router.get("/{code}/hints/{level}", response_model=HintResponse)
+def get_room_hint(code: str, level: int):
+    """Hint `level` (1 = vaguest) of the room's precomputed ladder."""
+    supabase = get_supabase_client()
+    room_result = supabase.table("rooms").select("id").eq("code", code.upper()).limit(1).execute()
+    if not room_result.data:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    hints = _load_room_hints(room_result.data[0]["id"])
+    if not 1 <= level <= len(hints):
+        raise HTTPException(status_code=404, detail="Pas d'autre indice")
+    return HintResponse(levels=len(hints), **hints[level - 1])
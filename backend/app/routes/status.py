@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+
+from ..services.admission import get_guess_admission
+from ..services.affinity import get_cluster
+from ..services.room_broadcast import get_room_broadcaster
+from ..services.room_hub import get_room_hub
+
+router = APIRouter(prefix="/api/status", tags=["status"])
+
+
+@router.get("/admission")
+async def admission_status():
+    """Guess admission counters (admitted and rejected requests, in-flight slots)."""
+    return get_guess_admission().stats()
+
+
+@router.get("/sockets")
+async def socket_status():
+    """Room sockets held by this worker."""
+    return get_room_hub().stats()
+
+
+@router.get("/broadcasts")
+async def broadcast_status():
+    """Coalesced realtime batches sent by this worker."""
+    return get_room_broadcaster().stats()
+
+
+@router.get("/affinity")
+async def affinity_status():
+    """Room affinity mode, this node and the nodes of the ring."""
+    cluster = get_cluster()
+    return {"mode": cluster.mode, "node": cluster.node_id, "nodes": cluster.node_urls}
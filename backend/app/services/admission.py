@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+
+from fastapi import HTTPException
+
+from ..config import get_settings
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, up to `capacity`."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def take(self, now: float) -> float:
+        """Consume one token. Returns 0 on success, else seconds until one is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else 60.0
+
+
+class BucketTable:
+    """Bounded LRU of token buckets; idle keys are evicted first."""
+
+    def __init__(self, rate: float, capacity: float, max_keys: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[tuple[str, ...], TokenBucket]" = OrderedDict()
+
+    def take(self, key: tuple[str, ...], now: float) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.capacity)
+            self._buckets[key] = bucket
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.take(now)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class GuessAdmission:
+    """Admission control for guess submission.
+
+    Requests are rejected with 429 before touching the database when the player
+    or the room exceeds its rate, or when too many guesses are already in flight.
+    """
+
+    def __init__(
+        self,
+        player_rate: float,
+        player_burst: int,
+        room_rate: float,
+        room_burst: int,
+        max_in_flight: int,
+        max_keys: int,
+    ):
+        self.max_in_flight = max_in_flight
+        self._players = BucketTable(player_rate, player_burst, max_keys)
+        self._rooms = BucketTable(room_rate, room_burst, max_keys)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.counters = {
+            "admitted": 0,
+            "rejected_player_rate": 0,
+            "rejected_room_rate": 0,
+            "rejected_overloaded": 0,
+        }
+
+    def _reject(self, counter: str, detail: str, retry_after: float) -> HTTPException:
+        self.counters[counter] += 1
+        return HTTPException(
+            status_code=429,
+            detail=detail,
+            headers={"Retry-After": str(max(1, round(retry_after)))},
+        )
+
+    @contextmanager
+    def admit(self, room_code: str, player_id: str) -> Iterator[None]:
+        """Hold an in-flight slot for the duration of the block, or raise 429."""
+        now = time.monotonic()
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                raise self._reject("rejected_overloaded", "Serveur surchargé, réessayez", 1)
+
+            wait = self._players.take((room_code, player_id), now)
+            if wait:
+                raise self._reject("rejected_player_rate", "Trop de propositions, ralentissez", wait)
+
+            wait = self._rooms.take((room_code,), now)
+            if wait:
+                raise self._reject("rejected_room_rate", "Trop de propositions dans ce salon", wait)
+
+            self._in_flight += 1
+            self.counters["admitted"] += 1
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self.counters,
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "tracked_players": len(self._players),
+                "tracked_rooms": len(self._rooms),
+            }
+
+
+@lru_cache(maxsize=1)
+def get_guess_admission() -> GuessAdmission:
+    settings = get_settings()
+    return GuessAdmission(
+        player_rate=settings.guess_rate_per_second,
+        player_burst=settings.guess_burst,
+        room_rate=settings.room_guess_rate_per_second,
+        room_burst=settings.room_guess_burst,
+        max_in_flight=settings.guess_max_in_flight,
+        max_keys=settings.rate_limit_max_keys,
+    )
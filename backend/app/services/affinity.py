@@ -0,0 +1,172 @@
+"""
+Room affinity across several API nodes.
+
+Each room code is owned by one node of CLUSTER_NODES on a consistent hash ring, so
+the in-process state kept per room (summaries, sockets, decoded secrets) stays hot
+on a single node. Contract, depending on ROOM_AFFINITY:
+
+- "off": single node, nothing is added.
+- "header": every room-scoped response carries `X-Room-Node` (owner name) and
+  `X-Room-Node-Url` (owner base URL); clients should send the next requests of that
+  room to that URL.
+- "redirect": same headers, and requests reaching the wrong node are answered with
+  307 to the owner (WebSockets are accepted then closed with code 4307 and the owner
+  URL as reason).
+
+Room-scoped requests are recognized by their `/api/rooms/{code}/...` path, the
+`X-Room-Code` header or the `roomCode` query parameter.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import parse_qs
+
+from ..config import get_settings
+from ..utils.hashring import HashRing
+
+logger = logging.getLogger(__name__)
+
+WS_CLOSE_REDIRECT = 4307
+
+_ROOM_PATH = re.compile(r"^/api/rooms/([A-Za-z0-9]+)/")
+
+
+class ClusterConfig:
+    def __init__(self, mode: str, node_id: str, node_urls: dict[str, str]):
+        self.mode = mode
+        self.node_id = node_id
+        self.node_urls = node_urls
+        self.ring = HashRing(list(node_urls)) if node_urls else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in ("header", "redirect") and self.ring is not None
+
+    def owner_of(self, room_code: str) -> Optional[str]:
+        if self.ring is None:
+            return None
+        return self.ring.node_for(room_code.upper())
+
+    def owns(self, room_code: str) -> bool:
+        owner = self.owner_of(room_code)
+        return owner is None or owner == self.node_id
+
+
+def parse_cluster_nodes(value: str) -> dict[str, str]:
+    """Parse "api-1=http://host1:8081,api-2=http://host2:8081" (order does not matter)."""
+    nodes: dict[str, str] = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, separator, url = item.partition("=")
+        if not separator or not name.strip() or not url.strip():
+            raise ValueError(f"Invalid CLUSTER_NODES entry '{item}' (expected name=url)")
+        nodes[name.strip()] = url.strip().rstrip("/")
+    return nodes
+
+
+@lru_cache(maxsize=1)
+def get_cluster() -> ClusterConfig:
+    settings = get_settings()
+    mode = settings.room_affinity.lower()
+    node_urls = parse_cluster_nodes(settings.cluster_nodes)
+    if mode != "off" and settings.node_id not in node_urls:
+        logger.error(f"NODE_ID '{settings.node_id}' not in CLUSTER_NODES; room affinity disabled")
+        mode = "off"
+    return ClusterConfig(mode, settings.node_id, node_urls)
+
+
+def room_code_from_scope(scope: dict) -> Optional[str]:
+    match = _ROOM_PATH.match(scope.get("path", ""))
+    if match:
+        return match.group(1).upper()
+    for name, value in scope.get("headers", []):
+        if name == b"x-room-code" and value:
+            return value.decode("latin-1").upper()
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    if query.get("roomCode"):
+        return query["roomCode"][0].upper()
+    return None
+
+
+class RoomAffinityMiddleware:
+    """ASGI middleware applying the header/redirect contract above."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        cluster = get_cluster()
+        if scope["type"] not in ("http", "websocket") or not cluster.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        # CORS preflights carry no room context and must never be redirected
+        room_code = None if scope.get("method") == "OPTIONS" else room_code_from_scope(scope)
+        if room_code is None:
+            await self.app(scope, receive, send)
+            return
+
+        owner = cluster.owner_of(room_code)
+        owner_url = cluster.node_urls[owner]
+        if cluster.mode == "redirect" and owner != cluster.node_id:
+            await self._redirect(scope, receive, send, owner, owner_url)
+            return
+
+        if scope["type"] == "websocket":
+            await self.app(scope, receive, send)
+            return
+
+        affinity_headers = [
+            (b"x-room-node", owner.encode("latin-1")),
+            (b"x-room-node-url", owner_url.encode("latin-1")),
+            (b"x-served-by", cluster.node_id.encode("latin-1")),
+        ]
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), *affinity_headers]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    @staticmethod
+    async def _redirect(scope, receive, send, owner: str, owner_url: str) -> None:
+        if scope["type"] == "websocket":
+            # Browsers don't follow redirects on the WebSocket handshake: accept, then
+            # close with the owner URL so the client reconnects there
+            await receive()
+            await send({"type": "websocket.accept"})
+            await send({"type": "websocket.close", "code": WS_CLOSE_REDIRECT, "reason": owner_url})
+            return
+
+        location = owner_url + scope.get("root_path", "") + scope["path"]
+        if scope.get("query_string"):
+            location += "?" + scope["query_string"].decode("latin-1")
+        await send({
+            "type": "http.response.start",
+            "status": 307,
+            "headers": [
+                (b"location", location.encode("latin-1")),
+                (b"x-room-node", owner.encode("latin-1")),
+                (b"x-room-node-url", owner_url.encode("latin-1")),
+                (b"content-length", b"0"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+
+def generate_local_room_code(generate, max_attempts: int = 64) -> str:
+    """Draw room codes until one is owned by this node, so the creator stays on it."""
+    cluster = get_cluster()
+    code = generate()
+    if not cluster.enabled:
+        return code
+    for _ in range(max_attempts):
+        if cluster.owns(code):
+            return code
+        code = generate()
+    return code
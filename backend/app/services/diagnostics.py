@@ -0,0 +1,224 @@
+"""
+Opt-in memory diagnostics (DIAGNOSTICS_ENABLED=true, endpoints under /api/admin/diagnostics).
+
+- Sizes of the long-lived structures of every loaded resources version: the
+  KeyedVectors matrices and vocabulary, each lexicon set/dict, the word pools
+  and derived indexes, plus the in-process room caches.
+- tracemalloc top allocators, once tracing is started (at boot with
+  TRACEMALLOC_FRAMES > 0, or through the API).
+- A sampling allocation profiler for submit_guess: a fraction of requests
+  (GUESS_PROFILE_SAMPLE_RATE) is wrapped in snapshots and the biggest
+  allocation deltas are kept in a ring buffer.
+
+Snapshots cover the whole process, so concurrent requests show up in each
+other's profiles; profile under controlled load for precise numbers.
+"""
+
+import gc
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import numpy as np
+
+from ..config import get_settings
+from ..embeddings import get_resources, loaded_resource_versions
+from .room_summary import cached_summaries
+
+MAX_PROFILES = 50
+PROFILE_TOP_ALLOCATIONS = 10
+
+
+def deep_sizeof(obj: object) -> int:
+    """Approximate retained size of a container graph (strings, numbers, arrays, nested containers)."""
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        # ndarray.__sizeof__ includes the data buffer when the array owns it
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+    return total
+
+
+def process_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, if /proc is available."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def _model_sizes(model) -> dict[str, int]:
+    sizes = {
+        "vectors": model.vectors.nbytes,
+        "norms": model.norms.nbytes if getattr(model, "norms", None) is not None else 0,
+        "index_to_key": deep_sizeof(model.index_to_key),
+        "key_to_index": deep_sizeof(model.key_to_index),
+    }
+    expandos = getattr(model, "expandos", None) or {}
+    sizes["expandos"] = sum(
+        value.nbytes for value in expandos.values() if isinstance(value, np.ndarray)
+    )
+    return sizes
+
+
+def _lexicon_sizes(lexicon) -> dict[str, int]:
+    # Each structure is measured on its own: strings shared between them are counted in each
+    return {name: deep_sizeof(value) for name, value in vars(lexicon).items()}
+
+
+def resources_memory(version: str) -> Optional[dict]:
+    resources = get_resources(version)
+    if resources is None:
+        return None
+
+    parts = resources.loaded_parts()
+    report: dict = {"loaded": sorted(parts)}
+    if "model" in parts:
+        report["model"] = _model_sizes(parts["model"])
+    if "lexicon" in parts:
+        report["lexicon"] = _lexicon_sizes(parts["lexicon"])
+    if "word_pools" in parts:
+        report["word_pools"] = deep_sizeof(parts["word_pools"])
+    if "eligible_indices" in parts:
+        report["eligible_indices"] = parts["eligible_indices"].nbytes
+    if "suggestion_index" in parts:
+        index = parts["suggestion_index"]
+        report["suggestion_index"] = {
+            "arrays": index.nbytes,
+            "words": deep_sizeof(index.words) + deep_sizeof(index.plain),
+        }
+    return report
+
+
+def _cache_sizes() -> dict:
+    summaries = cached_summaries()
+    return {
+        "room_summaries": len(summaries),
+        "room_summaries_bytes": sum(
+            deep_sizeof(summary.top_guesses) + deep_sizeof(summary.players) for summary in summaries
+        ),
+    }
+
+
+def memory_report() -> dict:
+    """Sizes of the main long-lived structures, in bytes."""
+    traced_current, traced_peak = tracemalloc.get_traced_memory()
+    return {
+        "rss": process_rss_bytes(),
+        "resources": {version: resources_memory(version) for version in loaded_resource_versions()},
+        "caches": _cache_sizes(),
+        "gc_counts": gc.get_count(),
+        "tracemalloc": {
+            "tracing": tracemalloc.is_tracing(),
+            "frames": tracemalloc.get_traceback_limit() if tracemalloc.is_tracing() else 0,
+            "current": traced_current,
+            "peak": traced_peak,
+            "overhead": tracemalloc.get_tracemalloc_memory(),
+        },
+    }
+
+
+def start_tracing(frames: int) -> None:
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(max(1, frames))
+
+
+def stop_tracing() -> None:
+    tracemalloc.stop()
+    _profiles.clear()
+
+
+def _format_stat(stat, traceback_frames: int = 1) -> dict:
+    frames = stat.traceback.format(limit=traceback_frames) if traceback_frames > 1 else []
+    frame = stat.traceback[0]
+    entry = {
+        "location": f"{frame.filename}:{frame.lineno}",
+        "size": stat.size,
+        "count": stat.count,
+    }
+    if hasattr(stat, "size_diff"):
+        entry["size_diff"] = stat.size_diff
+        entry["count_diff"] = stat.count_diff
+    if frames:
+        entry["traceback"] = frames
+    return entry
+
+
+def top_allocations(limit: int = 20, group_by: str = "lineno") -> list[dict]:
+    """Largest live allocations grouped by line, file or traceback (tracing must be on)."""
+    if not tracemalloc.is_tracing():
+        return []
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+    frames = tracemalloc.get_traceback_limit() if group_by == "traceback" else 1
+    return [_format_stat(stat, frames) for stat in snapshot.statistics(group_by)[:limit]]
+
+
+_profiles: deque = deque(maxlen=MAX_PROFILES)
+_profile_lock = threading.Lock()
+
+
+@contextmanager
+def profile_allocations(label: str) -> Iterator[None]:
+    """Record the allocation delta of a sampled fraction of calls (no-op otherwise)."""
+    settings = get_settings()
+    if (
+        not settings.diagnostics_enabled
+        or not tracemalloc.is_tracing()
+        or random.random() >= settings.guess_profile_sample_rate
+    ):
+        yield
+        return
+
+    # One profiled call at a time keeps snapshots from piling up under load
+    if not _profile_lock.acquire(blocking=False):
+        yield
+        return
+
+    try:
+        before = tracemalloc.take_snapshot()
+        current_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            current_after, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            diff = after.compare_to(before, "lineno")
+            _profiles.append({
+                "label": label,
+                "at": time.time(),
+                "duration_ms": round(elapsed * 1000, 2),
+                "retained": current_after - current_before,
+                "peak": peak - current_before,
+                "top": [_format_stat(stat) for stat in diff[:PROFILE_TOP_ALLOCATIONS]],
+            })
+    finally:
+        _profile_lock.release()
+
+
+def recent_profiles(label: Optional[str] = None) -> list[dict]:
+    return [profile for profile in list(_profiles) if label is None or profile["label"] == label]
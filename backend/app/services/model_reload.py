@@ -0,0 +1,133 @@
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..config import get_settings
+from ..embeddings import (
+    LEXICON_PATH,
+    WORD_POOLS_PATH,
+    EmbeddingResources,
+    activate_resources,
+    current_resources,
+    get_resources,
+    load_lexicon_data,
+    load_lexicon_normalized_data,
+    loaded_resource_versions,
+    release_inactive_resources,
+)
+
+logger = logging.getLogger(__name__)
+
+_MODEL_FILENAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+_reload_lock = threading.Lock()
+_status: dict = {"state": "idle", "version": None, "error": None, "started_at": None, "finished_at": None}
+
+
+def _allowed_data_dirs() -> list[Path]:
+    settings = get_settings()
+    dirs = [LEXICON_PATH.parent, WORD_POOLS_PATH.parent, Path(settings.word2vec_cache_dir)]
+    for configured in (settings.lexicon_path, settings.word_pools_path):
+        if configured:
+            dirs.append(Path(configured).parent)
+    return [directory.resolve() for directory in dirs]
+
+
+def validate_overrides(overrides: dict[str, str]) -> None:
+    """Only configured sources can be reloaded from. Raises ValueError otherwise."""
+    settings = get_settings()
+    model_url = overrides.get("model_url")
+    if model_url:
+        allowed_urls = {settings.word2vec_model_url} | {
+            url.strip() for url in settings.reload_model_urls.split(",") if url.strip()
+        }
+        if model_url not in allowed_urls:
+            raise ValueError("modelUrl is not one of the configured model URLs (RELOAD_MODEL_URLS)")
+
+    # Joined to the cache dir and used as the download target: a plain file name only
+    model_filename = overrides.get("model_filename")
+    if model_filename and (not _MODEL_FILENAME.match(model_filename) or model_filename in (".", "..")):
+        raise ValueError("modelFilename must be a plain file name inside the model cache directory")
+
+    allowed_dirs = _allowed_data_dirs()
+    for key, field in (("lexicon_path", "lexiconPath"), ("word_pools_path", "wordPoolsPath")):
+        path = overrides.get(key)
+        if not path:
+            continue
+        resolved = Path(path).resolve()
+        if not any(resolved.is_relative_to(directory) for directory in allowed_dirs):
+            raise ValueError(f"{field} must be inside the configured data directories")
+
+
+def _reload(overrides: dict[str, str]) -> None:
+    started = time.perf_counter()
+    try:
+        # Files may have changed in place; old versions keep their own Lexicon objects
+        load_lexicon_data.cache_clear()
+        load_lexicon_normalized_data.cache_clear()
+
+        resources = EmbeddingResources.from_settings(**overrides)
+        _status["version"] = resources.version
+        loaded = get_resources(resources.version)
+        if loaded is not None:
+            # Same model and lexicon (e.g. new pools only): no second copy of the model
+            resources.share_scoring_parts(loaded)
+        else:
+            # Make room first, so old + active + loading never coexist: at most
+            # MAX_RESOURCE_VERSIONS models are in memory, including the one loading
+            release_inactive_resources(max(1, get_settings().max_resource_versions - 1))
+        logger.info(f"Loading resources version {resources.version} in the background...")
+        resources.warm()
+        if not resources.word_pools:
+            raise RuntimeError(f"Word pools missing or empty at {resources.word_pools_path}")
+
+        activate_resources(resources)
+        _status["state"] = "ready"
+        logger.info(f"Resources version {resources.version} ready in {time.perf_counter() - started:.1f}s")
+    except Exception as e:
+        _status["state"] = "failed"
+        _status["error"] = str(e)
+        logger.error(f"Resources reload failed: {e}")
+    finally:
+        _status["finished_at"] = time.time()
+        _reload_lock.release()
+
+
+def start_reload(overrides: Optional[dict[str, str]] = None) -> bool:
+    """Load a new model/lexicon/pools version in a background thread.
+
+    Returns False if a reload is already running. The active version keeps
+    serving requests until the new one is fully loaded. Raises ValueError for
+    overrides outside the configured sources (see validate_overrides).
+    """
+    overrides = {key: value for key, value in (overrides or {}).items() if value}
+    validate_overrides(overrides)
+    if not _reload_lock.acquire(blocking=False):
+        return False
+
+    _status.update({
+        "state": "loading",
+        "version": None,
+        "error": None,
+        "started_at": time.time(),
+        "finished_at": None,
+    })
+    thread = threading.Thread(
+        target=_reload,
+        args=(overrides,),
+        name="resources-reload",
+        daemon=True,
+    )
+    thread.start()
+    return True
+
+
+def reload_status() -> dict:
+    return {
+        **_status,
+        "active_version": current_resources().version,
+        "loaded_versions": loaded_resource_versions(),
+    }
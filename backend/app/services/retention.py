@@ -0,0 +1,96 @@
+"""
+Room retention: move finished or idle rooms out of the hot tables.
+
+Each archived room becomes one `archived_rooms` row holding the room metadata,
+the secret word and its guesses as a compact JSON array of arrays. The live
+`rooms` row is then deleted, which cascades to `room_secrets` and `guesses`;
+both steps run in one SQL transaction.
+
+Run once from the command line:
+
+    python -m app.services.retention [--dry-run]
+
+or periodically from the API process by setting RETENTION_INTERVAL_MINUTES.
+"""
+
+import argparse
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from ..config import get_settings
+from .room_summary import forget_room
+from .supabase import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+
+def _find_candidates(status: str, cutoff: datetime, limit: int) -> list[dict]:
+    """Rooms of `status` without activity (creation or guess) since `cutoff`, oldest first.
+
+    See supabase/migrations/013_retention_candidates.sql.
+    """
+    supabase = get_supabase_client()
+    result = supabase.rpc(
+        "retention_candidates",
+        {"p_status": status, "p_cutoff": cutoff.isoformat(), "p_limit": limit},
+    ).execute()
+    return result.data or []
+
+
+def archive_room(room: dict) -> int:
+    """Copy a room, its secret word and its guesses to `archived_rooms`, then delete it.
+
+    Both happen in one transaction in SQL (supabase/migrations/014_archive_room.sql),
+    so no guess is deleted unarchived and the copy isn't capped by PostgREST's max rows.
+    Returns the number of guesses archived (0 if the room was already gone).
+    """
+    supabase = get_supabase_client()
+    result = supabase.rpc("archive_room", {"p_room_id": room["id"]}).execute()
+    forget_room(room["id"])
+    return result.data or 0
+
+
+def run_retention(now: Optional[datetime] = None, dry_run: bool = False) -> dict[str, int]:
+    """Archive finished and idle rooms older than the configured ages (one batch each)."""
+    settings = get_settings()
+    now = now or datetime.now(timezone.utc)
+    finished_cutoff = now - timedelta(hours=settings.retention_finished_after_hours)
+    idle_cutoff = now - timedelta(hours=settings.retention_idle_after_hours)
+
+    stats = {"rooms": 0, "guesses": 0, "failed": 0}
+
+    # Finished rooms age from their last (winning) guess, active ones from their last guess
+    candidates = _find_candidates("finished", finished_cutoff, settings.retention_batch_size)
+    candidates += _find_candidates("active", idle_cutoff, settings.retention_batch_size)
+
+    for room in candidates:
+        if dry_run:
+            logger.info(f"[dry-run] Would archive room {room['code']} ({room['status']})")
+            stats["rooms"] += 1
+            continue
+        try:
+            stats["guesses"] += archive_room(room)
+            stats["rooms"] += 1
+        except Exception as e:
+            stats["failed"] += 1
+            logger.error(f"Failed to archive room {room['code']}: {e}")
+
+    logger.info(
+        f"Retention run: archived {stats['rooms']} rooms ({stats['guesses']} guesses), "
+        f"failed {stats['failed']}"
+    )
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive finished and idle rooms.")
+    parser.add_argument("--dry-run", action="store_true", help="List rooms without archiving them")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    run_retention(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
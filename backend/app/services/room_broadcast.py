@@ -0,0 +1,168 @@
+"""
+Coalesced room updates over Supabase Realtime broadcast.
+
+Guesses and reveals are collected per room and flushed on a short tick
+(REALTIME_BATCH_INTERVAL_MS) as a single `batch` event on the `room:{roomId}`
+channel the clients already join for presence:
+
+    {
+        "guesses": [GuessRow, ...],       # new guesses of the tick, oldest first
+        "players": [PlayerSummary, ...],  # this node's stats of the players who guessed
+        "guessCount": int | null,         # room total, when the summary is cached here
+        "revealedWord": str | null,
+        "truncated": bool,                # more guesses than fit: clients resync by cursor
+    }
+
+A room therefore costs at most one message per tick and per node, whatever the
+number of guesses, instead of one replication event per inserted row and per
+subscriber. Stats come from this node's summary cache and can lag behind another
+node's, so clients merge them field by field with max rather than overwrite.
+Batches of a failed request are put back in front of the room's pending batch
+and sent on the next tick; past the guess cap they are marked truncated, so
+clients resync through /api/guesses?cursor=, as they also do on reconnect and
+tab refocus.
+"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Optional
+
+from ..config import get_settings
+from .room_summary import cached_summary
+
+logger = logging.getLogger(__name__)
+
+BATCH_EVENT = "batch"
+# Messages per request to the broadcast endpoint
+MAX_MESSAGES_PER_REQUEST = 100
+
+
+class PendingBatch:
+    def __init__(self):
+        self.guesses: list[dict] = []
+        self.player_ids: dict[str, None] = {}
+        self.revealed_word: Optional[str] = None
+        self.truncated = False
+
+
+class RoomBroadcaster:
+    """Per-room pending batches, filled from the request threads and flushed by one task."""
+
+    def __init__(self, supabase_url: str, api_key: str, max_guesses: int):
+        self.endpoint = f"{supabase_url.rstrip('/')}/realtime/v1/api/broadcast" if supabase_url else ""
+        self.api_key = api_key
+        self.max_guesses = max_guesses
+        self._pending: dict[str, PendingBatch] = {}
+        self._lock = threading.Lock()
+        self._session = None
+        self.flushes = 0
+        self.messages_sent = 0
+        self.guesses_sent = 0
+        self.failures = 0
+
+    def _batch(self, room_id: str) -> PendingBatch:
+        batch = self._pending.get(room_id)
+        if batch is None:
+            batch = self._pending[room_id] = PendingBatch()
+        return batch
+
+    def add_guess(self, guess: dict) -> None:
+        with self._lock:
+            batch = self._batch(guess["room_id"])
+            batch.player_ids[guess["player_id"]] = None
+            if len(batch.guesses) < self.max_guesses:
+                batch.guesses.append(guess)
+            else:
+                batch.truncated = True
+
+    def _requeue(self, failed: list[tuple[str, PendingBatch]]) -> None:
+        """Put unsent batches back ahead of what was queued since, for the next tick."""
+        with self._lock:
+            for room_id, batch in failed:
+                newer = self._pending.get(room_id)
+                if newer is not None:
+                    guesses = batch.guesses + newer.guesses
+                    batch.truncated = batch.truncated or newer.truncated or len(guesses) > self.max_guesses
+                    batch.guesses = guesses[:self.max_guesses]
+                    batch.player_ids.update(newer.player_ids)
+                    batch.revealed_word = newer.revealed_word or batch.revealed_word
+                self._pending[room_id] = batch
+
+    def reveal(self, room_id: str, word: str) -> None:
+        with self._lock:
+            self._batch(room_id).revealed_word = word
+
+    def _message(self, room_id: str, batch: PendingBatch) -> dict:
+        guess_count = None
+        players: list[dict] = []
+        summary = cached_summary(room_id)
+        if summary is not None:
+            guess_count, players = summary.player_stats(batch.player_ids)
+        return {
+            "topic": f"room:{room_id}",
+            "event": BATCH_EVENT,
+            "payload": {
+                "guesses": batch.guesses,
+                "players": players,
+                "guessCount": guess_count,
+                "revealedWord": batch.revealed_word,
+                "truncated": batch.truncated,
+            },
+        }
+
+    def _post(self, messages: list[dict]) -> None:
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            self._session.headers.update({
+                "apikey": self.api_key,
+                "Authorization": f"Bearer {self.api_key}",
+            })
+        response = self._session.post(self.endpoint, json={"messages": messages}, timeout=5)
+        response.raise_for_status()
+
+    def flush(self) -> int:
+        """Send one message per room with pending updates. Returns the number of messages."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending or not self.endpoint:
+            return 0
+
+        batches = list(pending.items())
+        messages = [self._message(room_id, batch) for room_id, batch in batches]
+        self.flushes += 1
+        for start in range(0, len(messages), MAX_MESSAGES_PER_REQUEST):
+            chunk = messages[start:start + MAX_MESSAGES_PER_REQUEST]
+            try:
+                self._post(chunk)
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Room broadcast of {len(chunk)} batches failed, retrying next tick: {e}")
+                self._requeue(batches[start:start + MAX_MESSAGES_PER_REQUEST])
+                continue
+            self.messages_sent += len(chunk)
+            self.guesses_sent += sum(len(message["payload"]["guesses"]) for message in chunk)
+        return len(messages)
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending_rooms = len(self._pending)
+        return {
+            "pending_rooms": pending_rooms,
+            "flushes": self.flushes,
+            "messages_sent": self.messages_sent,
+            "guesses_sent": self.guesses_sent,
+            "failures": self.failures,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_room_broadcaster() -> RoomBroadcaster:
+    settings = get_settings()
+    return RoomBroadcaster(
+        settings.supabase_url,
+        settings.supabase_service_role_key,
+        settings.realtime_batch_max_guesses,
+    )
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import WebSocket
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class RoomConnection:
+    """One player's socket plus a bounded outbound queue drained by its own writer task."""
+
+    def __init__(self, websocket: WebSocket, room_id: str, player_id: str, queue_size: int):
+        self.websocket = websocket
+        self.room_id = room_id
+        self.player_id = player_id
+        self.queue: asyncio.Queue[Optional[dict]] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+    def push(self, message: dict) -> bool:
+        """Queue a message without blocking. Returns False if the client is too slow."""
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def run_writer(self) -> None:
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                if self.dropped:
+                    # Try Again Later: the client reconnects and resyncs from its cursor
+                    await self.websocket.close(code=1013)
+                return
+            await self.websocket.send_json(message)
+
+    def close(self) -> None:
+        # Wake the writer so it exits even when the queue is full
+        while True:
+            try:
+                self.queue.put_nowait(None)
+                return
+            except asyncio.QueueFull:
+                self.queue.get_nowait()
+
+
+class RoomHub:
+    """In-process fan-out of room events to the WebSocket connections of this worker.
+
+    Publishing is thread-safe: sync route handlers running in the threadpool hand
+    messages over to the event loop that owns the sockets.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._rooms: dict[str, set[RoomConnection]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.dropped_slow_clients = 0
+
+    def connect(self, websocket: WebSocket, room_id: str, player_id: str) -> RoomConnection:
+        """Register a socket. Must be called from the event loop."""
+        connection = RoomConnection(websocket, room_id, player_id, self.queue_size)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._rooms.setdefault(room_id, set()).add(connection)
+        return connection
+
+    def disconnect(self, connection: RoomConnection) -> None:
+        with self._lock:
+            connections = self._rooms.get(connection.room_id)
+            if connections is not None:
+                connections.discard(connection)
+                if not connections:
+                    del self._rooms[connection.room_id]
+        connection.close()
+
+    def send(self, connection: RoomConnection, message: dict) -> None:
+        """Queue a message for one socket, dropping the socket if its queue is full."""
+        if connection.push(message):
+            return
+        logger.warning(
+            f"Dropping slow socket of player {connection.player_id} in room {connection.room_id}"
+        )
+        self.dropped_slow_clients += 1
+        connection.dropped = True
+        self.disconnect(connection)
+
+    def _deliver(self, room_id: str, message: dict) -> None:
+        with self._lock:
+            connections = list(self._rooms.get(room_id, ()))
+        for connection in connections:
+            self.send(connection, message)
+
+    def publish(self, room_id: str, message: dict) -> None:
+        """Send a message to every socket of a room, from any thread."""
+        with self._lock:
+            loop = self._loop
+            if loop is None or room_id not in self._rooms:
+                return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._deliver(room_id, message)
+        else:
+            loop.call_soon_threadsafe(self._deliver, room_id, message)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rooms": len(self._rooms),
+                "connections": sum(len(connections) for connections in self._rooms.values()),
+                "dropped_slow_clients": self.dropped_slow_clients,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_room_hub() -> RoomHub:
+    return RoomHub(get_settings().room_socket_queue_size)
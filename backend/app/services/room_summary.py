@@ -0,0 +1,283 @@
+"""
+In-process room summaries (top guesses and per-player stats).
+
+Each worker keeps its own LRU of summaries. Guesses accepted by this worker are
+folded in right away (record_guess); guesses inserted elsewhere (other workers or
+nodes) are picked up by an incremental refresh from the guesses table at most
+every ROOM_SUMMARY_REFRESH_SECONDS. The refresh re-reads an overlap window before
+the newest folded guess, so rows committed out of timestamp order are not missed,
+and guess ids dedupe what was already folded.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from ..config import get_settings
+from ..utils.cursor import CURSOR_SETTLE_SECONDS, after_filter, settled_cursor
+from .supabase import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+GUESS_COLUMNS = "id,room_id,player_id,player_name,word,score,rank,temperature,created_at"
+
+# Rows per page when reading guesses; must not exceed PostgREST's max-rows (1000 by
+# default on Supabase), since a short page is taken as the last one
+GUESS_PAGE_SIZE = 1000
+# Ids of folded guesses are remembered this long past the settle window, for dedup
+RECENT_ID_RETENTION_SECONDS = 60.0
+
+
+class RoomSummary:
+    """Incremental per-room aggregate: top-N guesses and per-player stats."""
+
+    def __init__(self, room_id: str, top_n: int):
+        self.room_id = room_id
+        self.top_n = top_n
+        self.guess_count = 0
+        self.top_guesses: list[dict] = []
+        # Sort keys mirror idx_guesses_room_score_created: score desc, created_at desc
+        self._top_keys: list[tuple[int, float]] = []
+        self.players: dict[str, dict] = {}
+        self.latest: Optional[dict] = None
+        self._latest_key: tuple[float, str] = (float("-inf"), "")
+        # Recently folded guesses by id, with their created_at: a guess can reach the summary
+        # twice (record_guess and a refresh), only the first one counts
+        self._recent: dict[str, tuple[float, dict]] = {}
+        self.refreshed_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def add(self, guess: dict) -> bool:
+        """Fold a single guess row into the summary. Returns False if it was already folded."""
+        created_at = datetime.fromisoformat(guess["created_at"]).timestamp()
+        with self._lock:
+            if guess["id"] in self._recent:
+                return False
+            self._recent[guess["id"]] = (created_at, guess)
+            self.guess_count += 1
+
+            player_id = guess["player_id"]
+            player = self.players.get(player_id)
+            if player is None:
+                player = {
+                    "playerId": player_id,
+                    "playerName": guess["player_name"],
+                    "bestScore": 0,
+                    "guessCount": 0,
+                }
+                self.players[player_id] = player
+            player["playerName"] = guess["player_name"]
+            player["guessCount"] += 1
+            player["bestScore"] = max(player["bestScore"], int(guess["score"]))
+
+            if (created_at, guess["id"]) > self._latest_key:
+                self._latest_key = (created_at, guess["id"])
+                self.latest = guess
+
+            key = (-int(guess["score"]), -created_at)
+            if len(self.top_guesses) >= self.top_n and key >= self._top_keys[-1]:
+                return True
+            index = bisect.bisect_left(self._top_keys, key)
+            self._top_keys.insert(index, key)
+            self.top_guesses.insert(index, guess)
+            if len(self.top_guesses) > self.top_n:
+                self._top_keys.pop()
+                self.top_guesses.pop()
+            return True
+
+    def sync_since(self) -> Optional[str]:
+        """Start of the window the next refresh reads (None: read everything)."""
+        with self._lock:
+            newest = self._latest_key[0]
+        if newest == float("-inf"):
+            return None
+        return datetime.fromtimestamp(newest - CURSOR_SETTLE_SECONDS, timezone.utc).isoformat()
+
+    def mark_refreshed(self) -> None:
+        with self._lock:
+            self.refreshed_at = time.monotonic()
+            cutoff = self._latest_key[0] - CURSOR_SETTLE_SECONDS - RECENT_ID_RETENTION_SECONDS
+            self._recent = {
+                guess_id: entry for guess_id, entry in self._recent.items() if entry[0] >= cutoff
+            }
+
+    def player_stats(self, player_ids) -> tuple[int, list[dict]]:
+        """Room guess count and copies of the given players' stats."""
+        with self._lock:
+            return self.guess_count, [
+                dict(self.players[player_id]) for player_id in player_ids if player_id in self.players
+            ]
+
+    def snapshot(self, limit: Optional[int] = None) -> dict:
+        """Return a copy safe to serialize outside the lock."""
+        with self._lock:
+            count = self.top_n if limit is None else min(limit, self.top_n)
+            cursor = None
+            recent: list[dict] = []
+            if self.latest is not None:
+                cursor = settled_cursor(self.latest["created_at"])
+                # Guesses past the (settled) cursor that the counts already include: clients
+                # mark them as seen so the overlap re-served after the cursor isn't counted twice
+                since = self._latest_key[0] - CURSOR_SETTLE_SECONDS
+                recent = [
+                    guess for created_at, guess in sorted(self._recent.values(), key=lambda entry: entry[0])
+                    if created_at >= since
+                ]
+            return {
+                "cursor": cursor,
+                "recentGuesses": recent,
+                "guessCount": self.guess_count,
+                "topGuesses": list(self.top_guesses[:count]),
+                "players": sorted(
+                    (dict(player) for player in self.players.values()),
+                    key=lambda player: -player["bestScore"],
+                ),
+            }
+
+
+_summaries: "OrderedDict[str, RoomSummary]" = OrderedDict()
+_summaries_lock = threading.Lock()
+# Rooms being built: one lock per room, and the guesses recorded during the build
+_build_locks: dict[str, threading.Lock] = {}
+_pending_guesses: dict[str, list[dict]] = {}
+
+
+def fetch_guesses(
+    room_id: str,
+    since: Optional[str] = None,
+    player_id: Optional[str] = None,
+) -> list[dict]:
+    """
+    Every guess of a room (optionally of one player, or from `since` on), oldest first.
+
+    Read by keyset pages on (created_at, id), served by idx_guesses_room_created_id:
+    a single select would be cut at PostgREST's max-rows.
+    """
+    supabase = get_supabase_client()
+    guesses: list[dict] = []
+    last: Optional[dict] = None
+    while True:
+        query = supabase.table("guesses").select(GUESS_COLUMNS).eq("room_id", room_id)
+        if player_id is not None:
+            query = query.eq("player_id", player_id)
+        if since is not None:
+            query = query.gte("created_at", since)
+        if last is not None:
+            query = query.or_(after_filter(last["created_at"], last["id"]))
+        page = query.order("created_at").order("id").limit(GUESS_PAGE_SIZE).execute().data or []
+        guesses.extend(page)
+        if len(page) < GUESS_PAGE_SIZE:
+            return guesses
+        last = page[-1]
+
+
+def _build_summary(room_id: str) -> RoomSummary:
+    """Rebuild a summary from the guesses table (cold path, once per room per process)."""
+    settings = get_settings()
+    summary = RoomSummary(room_id, settings.room_summary_top_n)
+    for guess in fetch_guesses(room_id):
+        summary.add(guess)
+    summary.mark_refreshed()
+    logger.info(f"Built summary for room {room_id} from {summary.guess_count} guesses")
+    return summary
+
+
+def refresh_summary(summary: RoomSummary) -> None:
+    """Fold guesses inserted since the last refresh, wherever they were accepted."""
+    # A refresh already running for this room will do
+    if not summary._refresh_lock.acquire(blocking=False):
+        return
+    try:
+        added = sum(summary.add(guess) for guess in fetch_guesses(summary.room_id, summary.sync_since()))
+        summary.mark_refreshed()
+        if added:
+            logger.info(f"Refreshed summary for room {summary.room_id}: {added} new guesses")
+    finally:
+        summary._refresh_lock.release()
+
+
+def get_room_summary(room_id: str) -> RoomSummary:
+    """Get the cached summary for a room, building it on first access and refreshing it when due."""
+    refresh_seconds = get_settings().room_summary_refresh_seconds
+    with _summaries_lock:
+        summary = _summaries.get(room_id)
+        if summary is not None:
+            _summaries.move_to_end(room_id)
+        else:
+            build_lock = _build_locks.setdefault(room_id, threading.Lock())
+
+    if summary is not None:
+        if time.monotonic() - summary.refreshed_at >= refresh_seconds:
+            try:
+                refresh_summary(summary)
+            except Exception as e:
+                # Serve the current (possibly stale) summary; the next call retries
+                logger.error(f"Failed to refresh summary for room {room_id}: {e}")
+        return summary
+
+    # One build per room: concurrent requests wait for it instead of reading the table again
+    with build_lock:
+        with _summaries_lock:
+            existing = _summaries.get(room_id)
+            if existing is not None:
+                return existing
+            _pending_guesses[room_id] = []
+
+        try:
+            summary = _build_summary(room_id)
+        except Exception:
+            with _summaries_lock:
+                _pending_guesses.pop(room_id, None)
+                _build_locks.pop(room_id, None)
+            raise
+
+        # Publish and stop buffering atomically, so record_guess never finds neither
+        with _summaries_lock:
+            pending = _pending_guesses.pop(room_id, [])
+            _build_locks.pop(room_id, None)
+            _summaries[room_id] = summary
+            while len(_summaries) > get_settings().room_summary_cache_size:
+                _summaries.popitem(last=False)
+
+    # Guesses recorded while the table was being read (ids dedupe those it already had)
+    for guess in pending:
+        summary.add(guess)
+    return summary
+
+
+def cached_summary(room_id: str) -> Optional[RoomSummary]:
+    """The room's summary if this process already holds it, without building it."""
+    with _summaries_lock:
+        return _summaries.get(room_id)
+
+
+def record_guess(guess: dict) -> None:
+    """Apply a freshly inserted guess to its room summary if it is cached or being built.
+
+    Other uncached rooms are skipped: the next cold build reads the row from the database.
+    """
+    room_id = guess["room_id"]
+    with _summaries_lock:
+        summary = _summaries.get(room_id)
+        if summary is None:
+            pending = _pending_guesses.get(room_id)
+            if pending is not None:
+                pending.append(guess)
+            return
+    summary.add(guess)
+
+
+def cached_summaries() -> list[RoomSummary]:
+    with _summaries_lock:
+        return list(_summaries.values())
+
+
+def forget_room(room_id: str) -> None:
+    """Drop a room's cached summary (e.g. once the room has been archived)."""
+    with _summaries_lock:
+        _summaries.pop(room_id, None)
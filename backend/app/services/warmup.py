@@ -0,0 +1,137 @@
+"""
+Staged startup warmup.
+
+Stages run as soon as their dependencies are ready, in parallel when possible:
+
+    lexicon ─┐   ┌─> word_pools
+             ├───┤
+    model ───┘   └─> eligible_indices ─> suggestion_index
+
+The worker is ready (GET /health/ready) once every critical stage succeeded,
+i.e. once a room can be created and a guess scored without loading anything.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional
+
+from ..embeddings import EmbeddingResources, current_resources
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[EmbeddingResources], object],
+        after: tuple[str, ...],
+        critical: bool,
+    ):
+        self.name = name
+        self.run = run
+        self.after = after
+        self.critical = critical
+        self.state = "pending"
+        self.seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.done = threading.Event()
+
+
+def _load_word_pools(resources: EmbeddingResources) -> None:
+    if not resources.word_pools:
+        raise RuntimeError("Word pools missing or empty (backend/data/word_pools.json or WORD_POOLS_PATH)")
+
+
+def _load_model(resources: EmbeddingResources) -> None:
+    # Norms are needed by every similarity computation: compute them off the request path
+    resources.model.fill_norms()
+
+
+STAGES = (
+    ("lexicon", lambda resources: resources.lexicon, (), True),
+    ("model", _load_model, (), True),
+    ("word_pools", _load_word_pools, ("lexicon", "model"), True),
+    ("eligible_indices", lambda resources: resources.eligible_indices, ("lexicon", "model"), True),
+    # Only used for rejected guesses, and built lazily if missing
+    ("suggestion_index", lambda resources: resources.suggestion_index, ("eligible_indices",), False),
+)
+
+
+class Warmup:
+    def __init__(self):
+        self.stages = {name: Stage(name, run, after, critical) for name, run, after, critical in STAGES}
+        self.started_at: Optional[float] = None
+        self.seconds: Optional[float] = None
+
+    def _run_stage(self, stage: Stage, resources: EmbeddingResources) -> None:
+        try:
+            for dependency in stage.after:
+                self.stages[dependency].done.wait()
+                if self.stages[dependency].state != "ready":
+                    stage.state = "skipped"
+                    stage.error = f"{dependency} failed"
+                    logger.error(f"Warmup stage {stage.name} skipped: {dependency} failed")
+                    return
+
+            stage.state = "running"
+            logger.info(f"Warmup stage {stage.name} started")
+            started = time.perf_counter()
+            try:
+                stage.run(resources)
+            except Exception as e:
+                stage.state = "failed"
+                stage.error = str(e)
+                logger.error(f"Warmup stage {stage.name} failed: {e}")
+                return
+            finally:
+                stage.seconds = round(time.perf_counter() - started, 2)
+
+            stage.state = "ready"
+            logger.info(f"Warmup stage {stage.name} ready in {stage.seconds}s")
+        finally:
+            stage.done.set()
+
+    def run(self) -> None:
+        """Run every stage (blocking); dependencies are awaited per stage, not per level."""
+        self.started_at = time.time()
+        started = time.perf_counter()
+        resources = current_resources()
+        logger.info(f"Warming up resources version {resources.version}...")
+
+        with ThreadPoolExecutor(max_workers=len(self.stages), thread_name_prefix="warmup") as executor:
+            for stage in self.stages.values():
+                executor.submit(self._run_stage, stage, resources)
+
+        self.seconds = round(time.perf_counter() - started, 2)
+        if self.ready:
+            logger.info(f"Warmup done in {self.seconds}s, worker ready")
+        else:
+            logger.error(f"Warmup finished in {self.seconds}s with failed stages, worker not ready")
+
+    @property
+    def ready(self) -> bool:
+        return all(stage.state == "ready" for stage in self.stages.values() if stage.critical)
+
+    def status(self) -> dict:
+        return {
+            "ready": self.ready,
+            "startup_seconds": self.seconds,
+            "stages": {
+                name: {
+                    "state": stage.state,
+                    "seconds": stage.seconds,
+                    "critical": stage.critical,
+                    **({"error": stage.error} if stage.error else {}),
+                }
+                for name, stage in self.stages.items()
+            },
+        }
+
+
+@lru_cache(maxsize=1)
+def get_warmup() -> Warmup:
+    return Warmup()
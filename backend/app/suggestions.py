@@ -0,0 +1,127 @@
+"""
+Spelling suggestions for rejected guesses.
+
+Symmetric-delete index over the accent-stripped allowed vocabulary: every word is
+stored under itself and each of its single-character deletions, and a query looks
+up its own deletions the same way. That finds every word one edit away (insertion,
+deletion, substitution, transposition) plus accent-only differences with a handful
+of binary searches, without scanning the vocabulary.
+"""
+
+import logging
+import time
+from typing import Iterator
+
+import numpy as np
+
+from .embeddings import current_resources, normalize_word, strip_accents
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUGGESTIONS = 3
+# Longer inputs are not typos of a dictionary word
+MAX_WORD_LENGTH = 32
+# Single deletions on both sides guarantee every word one edit away, not two
+MAX_DISTANCE = 1
+
+
+def _deletes(word: str) -> Iterator[str]:
+    yield word
+    for position in range(len(word)):
+        yield word[:position] + word[position + 1:]
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent transpositions)."""
+    if a == b:
+        return 0
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class SuggestionIndex:
+    """Deletion-neighborhood index over vocabulary words, kept as two flat numpy arrays.
+
+    `words` must be ordered by preference (model vocabulary order, i.e. most frequent
+    first); ties on edit distance are broken by that order.
+    """
+
+    def __init__(self, words: list[str]):
+        started = time.perf_counter()
+        self.words = words
+        self.plain = [strip_accents(word) for word in words]
+
+        keys: list[int] = []
+        positions: list[int] = []
+        for position, plain in enumerate(self.plain):
+            for key in set(_deletes(plain)):
+                keys.append(hash(key))
+                positions.append(position)
+
+        order = np.argsort(np.asarray(keys, dtype=np.int64), kind="stable")
+        self._keys = np.asarray(keys, dtype=np.int64)[order]
+        self._positions = np.asarray(positions, dtype=np.int32)[order]
+        logger.info(
+            f"Built suggestion index: {len(words)} words, {len(self._keys)} keys "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self._keys.nbytes + self._positions.nbytes
+
+    def suggest(self, word: str, limit: int = DEFAULT_SUGGESTIONS) -> list[str]:
+        """Closest known words to `word`, best first (the word itself excluded)."""
+        query = normalize_word(word)
+        query_plain = strip_accents(query)
+        if not query_plain or len(query_plain) > MAX_WORD_LENGTH:
+            return []
+
+        hashed = np.fromiter((hash(key) for key in set(_deletes(query_plain))), dtype=np.int64)
+        starts = np.searchsorted(self._keys, hashed, side="left")
+        ends = np.searchsorted(self._keys, hashed, side="right")
+        candidates: set[int] = set()
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if start < end:
+                candidates.update(self._positions[start:end].tolist())
+
+        scored: list[tuple[int, int, int]] = []
+        for position in candidates:
+            candidate = self.words[position]
+            if candidate == query:
+                continue
+            # Hash collisions and two-sided deletions can match farther words: verify
+            distance = edit_distance(query_plain, self.plain[position])
+            if distance > MAX_DISTANCE:
+                continue
+            # Closer words first, then the right accents, then more frequent words
+            scored.append((distance, edit_distance(query, candidate), position))
+
+        scored.sort()
+        return [self.words[position] for _, _, position in scored[:limit]]
+
+
+def build_suggestion_index(model, eligible_indices: np.ndarray) -> SuggestionIndex:
+    words = [normalize_word(model.index_to_key[index]) for index in np.sort(eligible_indices)]
+    # Vocabulary keys that only differ by case map to the same word: keep the first
+    unique: list[str] = []
+    seen: set[str] = set()
+    for word in words:
+        if word not in seen:
+            seen.add(word)
+            unique.append(word)
+    return SuggestionIndex(unique)
+
+
+def suggest_corrections(word: str, limit: int = DEFAULT_SUGGESTIONS) -> list[str]:
+    """Suggestions for a rejected guess from the current resources version's index."""
+    return current_resources().suggestion_index.suggest(word, limit)
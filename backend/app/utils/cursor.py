@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+CURSOR_SEPARATOR = "|"
+
+# created_at defaults to NOW(), the transaction start: concurrent inserts can commit out
+# of timestamp order. Cursors handed to clients are therefore held back this long
+# before the newest row they cover; the overlap is served again and clients dedupe by id.
+CURSOR_SETTLE_SECONDS = 5.0
+# Sorts before every real id, so a settled cursor includes all rows at its timestamp
+MIN_GUESS_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def encode_cursor(created_at: str, guess_id: str) -> str:
+    """Build an opaque guess cursor from a row's (created_at, id) pair."""
+    return f"{created_at}{CURSOR_SEPARATOR}{guess_id}"
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple[str, str]]:
+    """Split a cursor back into (created_at, id). Raises ValueError if malformed."""
+    if not cursor:
+        return None
+    created_at, separator, guess_id = cursor.rpartition(CURSOR_SEPARATOR)
+    if not separator or not created_at or not guess_id:
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    # Both parts are compared and pasted into PostgREST filters: only accept an
+    # offset-aware timestamp and a UUID
+    try:
+        timestamp = datetime.fromisoformat(created_at)
+        guess_id = str(uuid.UUID(guess_id))
+    except ValueError:
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    if timestamp.tzinfo is None:
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    return created_at, guess_id
+
+
+def after_filter(created_at: str, guess_id: str) -> str:
+    """PostgREST `or` filter selecting rows after (created_at, id) in keyset order."""
+    return f'created_at.gt."{created_at}",and(created_at.eq."{created_at}",id.gt.{guess_id})'
+
+
+def settled_cursor(created_at: str) -> str:
+    """Cursor CURSOR_SETTLE_SECONDS before a row's created_at (see above)."""
+    settled = datetime.fromisoformat(created_at) - timedelta(seconds=CURSOR_SETTLE_SECONDS)
+    return encode_cursor(settled.isoformat(), MIN_GUESS_ID)
+
+
+def cursor_time(created_at: str) -> datetime:
+    return datetime.fromisoformat(created_at)
@@ -0,0 +1,29 @@
+import bisect
+import hashlib
+from typing import Sequence
+
+
+def _hash(value: str) -> int:
+    # Stable across processes and machines, unlike hash()
+    return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes.
+
+    Adding or removing a node only moves the keys of that node (about 1/N of them).
+    """
+
+    def __init__(self, nodes: Sequence[str], replicas: int = 128):
+        if not nodes:
+            raise ValueError("HashRing needs at least one node")
+        points = sorted(
+            (_hash(f"{node}#{replica}"), node) for node in nodes for replica in range(replicas)
+        )
+        self.nodes = list(nodes)
+        self._hashes = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+
+    def node_for(self, key: str) -> str:
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[index]
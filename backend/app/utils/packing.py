@@ -0,0 +1,62 @@
+import struct
+from typing import Sequence, Union
+
+import numpy as np
+
+# Layout: header (version u8, pad u8, count u16) + count * u32 word indices + count * f16 similarities
+PACK_VERSION = 1
+_HEADER = struct.Struct("<BxH")
+_INDEX_DTYPE = np.dtype("<u4")
+_SIMILARITY_DTYPE = np.dtype("<f2")
+_FLOAT_DTYPE = np.dtype("<f4")
+
+
+def pack_top_words(indices: Sequence[int], similarities: Sequence[float]) -> bytes:
+    """Pack vocabulary indices and similarities (ordered closest first) into bytes."""
+    if len(indices) != len(similarities):
+        raise ValueError("indices and similarities must have the same length")
+    return (
+        _HEADER.pack(PACK_VERSION, len(indices))
+        + np.asarray(indices, dtype=_INDEX_DTYPE).tobytes()
+        + np.asarray(similarities, dtype=_SIMILARITY_DTYPE).tobytes()
+    )
+
+
+def unpack_top_words(blob: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Decode `pack_top_words` output into (uint32 indices, float32 similarities)."""
+    version, count = _HEADER.unpack_from(blob)
+    if version != PACK_VERSION:
+        raise ValueError(f"Unsupported top words pack version {version}")
+    offset = _HEADER.size
+    indices = np.frombuffer(blob, dtype=_INDEX_DTYPE, count=count, offset=offset)
+    offset += count * _INDEX_DTYPE.itemsize
+    similarities = np.frombuffer(blob, dtype=_SIMILARITY_DTYPE, count=count, offset=offset)
+    return indices, similarities.astype(np.float32)
+
+
+def encode_bytea(data: bytes) -> str:
+    """Encode bytes for a Postgres bytea column through PostgREST (hex format)."""
+    return "\\x" + data.hex()
+
+
+def decode_bytea(value: Union[str, bytes, memoryview]) -> bytes:
+    """Decode a bytea value as returned by PostgREST ("\\x" + hex)."""
+    if isinstance(value, (bytes, memoryview)):
+        return bytes(value)
+    if value.startswith("\\x"):
+        return bytes.fromhex(value[2:])
+    raise ValueError("Unsupported bytea encoding")
+
+
+def pack_floats(values: Sequence[float]) -> bytes:
+    """Pack a float32 array (e.g. a similarity quantile table) with a count header."""
+    array = np.asarray(values, dtype=_FLOAT_DTYPE)
+    return _HEADER.pack(PACK_VERSION, len(array)) + array.tobytes()
+
+
+def unpack_floats(blob: bytes) -> np.ndarray:
+    """Decode `pack_floats` output."""
+    version, count = _HEADER.unpack_from(blob)
+    if version != PACK_VERSION:
+        raise ValueError(f"Unsupported float pack version {version}")
+    return np.frombuffer(blob, dtype=_FLOAT_DTYPE, count=count, offset=_HEADER.size)
@@ -18,12 +18,15 @@ function App() {
     guesses,
     submittedWords,
     presentPlayers,
+    playerSummaries,
+    hints,
     isLoading,
     error,
     guessValidationPulse,
     createRoom,
     joinRoom,
     submitGuess,
+    requestHint,
     leaveRoom,
   } = useRoom({ playerId, playerName });
 
@@ -64,10 +67,13 @@ function App() {
             room={room}
             guesses={guesses}
             presentPlayers={presentPlayers}
+            playerSummaries={playerSummaries}
+            hints={hints}
             playerId={playerId}
             submittedWords={submittedWords}
             guessValidationPulse={guessValidationPulse}
             onSubmitGuess={handleSubmitGuess}
+            onRequestHint={requestHint}
             onLeaveRoom={handleLeaveRoom}
             isLoading={isLoading}
           />
@@ -1,22 +1,62 @@
 const API_URL = import.meta.env.VITE_API_URL || "http://localhost:8081";
 
+// Node owning each room when the API runs several instances (X-Room-Node-Url contract)
+const roomNodeUrls = new Map<string, string>();
+
+/** Base URL to use for a room's requests: its owner node once known, else VITE_API_URL. */
+export function getRoomApiUrl(roomCode?: string): string {
+    if (!roomCode) return API_URL;
+    return roomNodeUrls.get(roomCode.toUpperCase()) ?? API_URL;
+}
+
+export function setRoomApiUrl(roomCode: string, url: string): void {
+    roomNodeUrls.set(roomCode.toUpperCase(), url);
+}
+
+export class ApiError extends Error {
+    readonly status: number;
+    /** Spelling suggestions returned with a rejected guess */
+    readonly suggestions: string[];
+
+    constructor(message: string, status: number, suggestions: string[] = []) {
+        super(message);
+        this.name = "ApiError";
+        this.status = status;
+        this.suggestions = suggestions;
+    }
+}
+
 export async function apiFetch<T>(
     path: string,
-    options: RequestInit = {}
+    options: RequestInit = {},
+    roomCode?: string
 ): Promise<T> {
     const headers = new Headers(options.headers);
 
     if (!headers.has("Content-Type") && options.body) {
         headers.set("Content-Type", "application/json");
     }
+    // GETs carry the code in their path or roomCode parameter: a custom header would
+    // cost them a CORS preflight each. POST bodies aren't visible to the routing layer.
+    const method = (options.method ?? "GET").toUpperCase();
+    if (roomCode && method !== "GET" && method !== "HEAD") {
+        headers.set("X-Room-Code", roomCode.toUpperCase());
+    }
 
-    const response = await fetch(`${API_URL}${path}`, {
+    const response = await fetch(`${getRoomApiUrl(roomCode)}${path}`, {
         ...options,
         headers,
     });
 
+    // Go straight to the owner next time instead of through a redirect
+    const nodeUrl = response.headers.get("X-Room-Node-Url");
+    if (roomCode && nodeUrl) {
+        setRoomApiUrl(roomCode, nodeUrl);
+    }
+
     if (!response.ok) {
         let message = "Request failed";
+        let suggestions: string[] = [];
         try {
             const data = await response.json();
             if (typeof data?.detail === "string") {
@@ -24,10 +64,13 @@ export async function apiFetch<T>(
             } else if (typeof data?.message === "string") {
                 message = data.message;
             }
+            if (Array.isArray(data?.suggestions)) {
+                suggestions = data.suggestions;
+            }
         } catch {
             // Ignore parsing errors for non-JSON responses.
         }
-        throw new Error(message);
+        throw new ApiError(message, response.status, suggestions);
     }
 
     return response.json() as Promise<T>;
@@ -1,5 +1,4 @@
-import { supabase } from "@/lib/supabase";
-import type { SubmitGuessResponse } from "@/lib/types";
+import type { GuessPageResponse, SubmitGuessResponse } from "@/lib/types";
 import type { GuessData } from "@/models/Guess";
 import { Guess } from "@/models/Guess";
 import { apiFetch } from "./client";
@@ -11,24 +10,43 @@ interface SubmitGuessParams {
     word: string;
 }
 
-export async function fetchGuessesByRoomId(roomId: string): Promise<Guess[]> {
-    const { data, error } = await supabase
-        .from("guesses")
-        .select("*")
-        .eq("room_id", roomId)
-        .order("score", { ascending: false })
-        .order("created_at", { ascending: false });
+export async function fetchGuessesSince(
+    roomId: string,
+    cursor: string | null,
+    roomCode?: string
+): Promise<{ guesses: Guess[]; cursor: string | null }> {
+    const guesses: Guess[] = [];
+    let nextCursor = cursor;
 
-    if (error) throw error;
+    for (;;) {
+        const params = new URLSearchParams({ roomId });
+        if (nextCursor) params.set("cursor", nextCursor);
+        // Routes the request to the room's node, like the X-Room-Code header
+        if (roomCode) params.set("roomCode", roomCode.toUpperCase());
 
-    return (data ?? []).map((guess) => Guess.fromApi(guess as GuessData));
+        const page = await apiFetch<GuessPageResponse>(
+            `/api/guesses?${params.toString()}`,
+            {},
+            roomCode
+        );
+        guesses.push(...page.guesses.map((guess) => Guess.fromApi(guess as GuessData)));
+        nextCursor = page.nextCursor;
+
+        if (!page.hasMore) break;
+    }
+
+    return { guesses, cursor: nextCursor };
 }
 
 export async function submitGuess(
     params: SubmitGuessParams
 ): Promise<SubmitGuessResponse> {
-    return apiFetch<SubmitGuessResponse>("/api/guesses", {
-        method: "POST",
-        body: JSON.stringify(params),
-    });
+    return apiFetch<SubmitGuessResponse>(
+        "/api/guesses",
+        {
+            method: "POST",
+            body: JSON.stringify(params),
+        },
+        params.roomCode
+    );
 }
@@ -1,5 +1,10 @@
 import { supabase } from "@/lib/supabase";
-import type { CreateRoomResponse } from "@/lib/types";
+import type {
+    CreateRoomResponse,
+    HintResponse,
+    PlayerSummary,
+    RoomSummaryResponse,
+} from "@/lib/types";
 import type { GuessData } from "@/models/Guess";
 import { Guess } from "@/models/Guess";
 import type { RoomData, RoomMode } from "@/models/Room";
@@ -49,23 +54,47 @@ export async function createRoom(
     return Room.fromApi(response.room as RoomData);
 }
 
-export async function fetchRoomWithGuessesByCode(
-    roomCode: string
-): Promise<{ room: Room; guesses: Guess[] }> {
-    const { data, error } = await supabase
-        .from("rooms")
-        .select("*, guesses(*)")
-        .eq("code", roomCode.toUpperCase())
-        .single();
+export async function fetchRoomSummaryByCode(
+    roomCode: string,
+    playerId?: string
+): Promise<{
+    room: Room;
+    guesses: Guess[];
+    players: PlayerSummary[];
+    cursor: string | null;
+}> {
+    const params = new URLSearchParams();
+    if (playerId) params.set("playerId", playerId);
+    const query = params.toString();
 
-    if (error || !data) {
-        throw error ?? new Error("Room not found");
+    const response = await apiFetch<RoomSummaryResponse>(
+        `/api/rooms/${encodeURIComponent(roomCode.toUpperCase())}/summary${query ? `?${query}` : ""}`,
+        {},
+        roomCode
+    );
+
+    const guessesById = new Map<string, Guess>();
+    // Recent guesses are re-served after the cursor: listing them marks them as seen
+    for (const guess of [
+        ...response.topGuesses,
+        ...response.playerGuesses,
+        ...(response.recentGuesses ?? []),
+    ]) {
+        guessesById.set(guess.id, Guess.fromApi(guess as GuessData));
     }
 
-    const room = Room.fromApi(data as RoomData);
-    const guesses = (data.guesses ?? []).map((guess: GuessData) =>
-        Guess.fromApi(guess)
-    );
+    return {
+        room: Room.fromApi(response.room as RoomData),
+        guesses: Array.from(guessesById.values()),
+        players: response.players,
+        cursor: response.cursor,
+    };
+}
 
-    return { room, guesses };
+export async function fetchHint(roomCode: string, level: number): Promise<HintResponse> {
+    return apiFetch<HintResponse>(
+        `/api/rooms/${encodeURIComponent(roomCode.toUpperCase())}/hints/${level}`,
+        {},
+        roomCode
+    );
 }
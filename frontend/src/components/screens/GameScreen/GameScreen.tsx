@@ -3,11 +3,13 @@ import { GameState } from "@/models/GameState";
 import type { Room } from "@/models/Room";
 import type { Guess } from "@/models/Guess";
 import type { PlayerPresenceData } from "@/models/Player";
+import type { HintResponse, PlayerSummary } from "@/lib/types";
 import { PlayerWithStats } from "@/models/Player";
 import { GameHeader } from "./GameHeader";
 import { TemperatureCard } from "./TemperatureCard";
 import { VictoryBanner } from "./VictoryBanner";
 import { GuessForm } from "./GuessForm";
+import { HintLadder } from "./HintLadder";
 import { GuessesTable } from "./GuessesTable";
 import { PlayerSidebar } from "./PlayerSidebar";
 
@@ -15,10 +17,13 @@ interface GameScreenProps {
     room: Room;
     guesses: Guess[];
     presentPlayers: PlayerPresenceData[];
+    playerSummaries: Map<string, PlayerSummary>;
+    hints: HintResponse[];
     playerId: string;
     submittedWords: Set<string>;
     guessValidationPulse: number;
     onSubmitGuess: (word: string) => Promise<{ score: number } | null>;
+    onRequestHint: () => Promise<HintResponse | null>;
     onLeaveRoom: () => void;
     isLoading: boolean;
 }
@@ -33,10 +38,13 @@ export function GameScreen({
     room,
     guesses,
     presentPlayers,
+    playerSummaries,
+    hints,
     playerId,
     submittedWords,
     guessValidationPulse,
     onSubmitGuess,
+    onRequestHint,
     onLeaveRoom,
     isLoading,
 }: GameScreenProps) {
@@ -46,8 +54,14 @@ export function GameScreen({
     );
 
     const players = useMemo(
-        () => PlayerWithStats.fromPresenceAndGuesses(presentPlayers, guesses, playerId),
-        [presentPlayers, guesses, playerId]
+        () =>
+            PlayerWithStats.fromPresenceAndGuesses(
+                presentPlayers,
+                guesses,
+                playerId,
+                playerSummaries
+            ),
+        [presentPlayers, guesses, playerId, playerSummaries]
     );
 
     const blockedWords = useMemo(() => {
@@ -88,12 +102,15 @@ export function GameScreen({
                         {room.revealedWord ? (
                             <VictoryBanner revealedWord={room.revealedWord} />
                         ) : (
-                            <GuessForm
-                                isLoading={isLoading}
-                                blockedWords={blockedWords}
-                                validationPulse={guessValidationPulse}
-                                onSubmitGuess={onSubmitGuess}
-                            />
+                            <>
+                                <GuessForm
+                                    isLoading={isLoading}
+                                    blockedWords={blockedWords}
+                                    validationPulse={guessValidationPulse}
+                                    onSubmitGuess={onSubmitGuess}
+                                />
+                                <HintLadder hints={hints} onRequestHint={onRequestHint} />
+                            </>
                         )}
 
                         <div className="text-center flex retro gap-8 items-center justify-start">
@@ -0,0 +1,46 @@
+import { useState } from "react";
+import { Button } from "@/components/ui/8bit/button";
+import type { HintResponse } from "@/lib/types";
+import { formatTemperature, getTemperatureTextColor } from "@/lib/temperature";
+
+interface HintLadderProps {
+    hints: HintResponse[];
+    onRequestHint: () => Promise<HintResponse | null>;
+}
+
+export function HintLadder({ hints, onRequestHint }: HintLadderProps) {
+    const [isLoading, setIsLoading] = useState(false);
+    const levels = hints.at(-1)?.levels;
+    const isExhausted = levels !== undefined && hints.length >= levels;
+
+    const handleClick = async () => {
+        setIsLoading(true);
+        try {
+            await onRequestHint();
+        } finally {
+            setIsLoading(false);
+        }
+    };
+
+    return (
+        <div className="mt-3 flex retro gap-4 items-center justify-start flex-wrap text-xs">
+            <Button
+                type="button"
+                variant="outline"
+                size="sm"
+                disabled={isLoading || isExhausted}
+                onClick={handleClick}
+            >
+                {isExhausted ? "Plus d'indice" : "Indice"}
+            </Button>
+            {hints.map((hint) => (
+                <span key={hint.level} className="flex items-center gap-2">
+                    <span className="font-medium">{hint.word}</span>
+                    <span className={getTemperatureTextColor(hint.temperature)}>
+                        {formatTemperature(hint.temperature)} · {hint.rank}‰
+                    </span>
+                </span>
+            ))}
+        </div>
+    );
+}
@@ -0,0 +1,156 @@
+import { useCallback, useEffect, useRef } from "react";
+import { ApiError, getRoomApiUrl, setRoomApiUrl } from "@/api/client";
+import type { SubmitGuessResponse } from "@/lib/types";
+import type { GuessData } from "@/models/Guess";
+import { Guess } from "@/models/Guess";
+
+const SOCKET_ENABLED = import.meta.env.VITE_GUESS_SOCKET !== "false";
+const RECONNECT_MAX_DELAY_MS = 10_000;
+const PING_INTERVAL_MS = 25_000;
+
+// Server close codes after which reconnecting is pointless
+const FATAL_CLOSE_CODES = new Set([4403, 4404, 4422]);
+// Room owned by another API node: the close reason is that node's URL
+const REDIRECT_CLOSE_CODE = 4307;
+
+interface UseGuessSocketOptions {
+    roomCode: string | null;
+    playerId: string;
+    playerName: string;
+    onGuess: (guess: Guess) => void;
+    onOpen?: () => void;
+}
+
+interface UseGuessSocketReturn {
+    /** Submit over the socket, or return null if it is not connected (use HTTP instead). */
+    submitGuess: (word: string) => Promise<SubmitGuessResponse> | null;
+}
+
+interface PendingGuess {
+    resolve: (response: SubmitGuessResponse) => void;
+    reject: (error: Error) => void;
+}
+
+type ServerMessage =
+    | ({ type: "guessResult"; requestId: string } & SubmitGuessResponse)
+    | { type: "guess"; guess: GuessData }
+    | {
+          type: "error";
+          requestId: string | null;
+          status: number;
+          detail: string;
+          suggestions?: string[];
+      }
+    | { type: "pong" };
+
+function socketUrl(roomCode: string, playerId: string, playerName: string): string {
+    const base = getRoomApiUrl(roomCode).replace(/^http/, "ws");
+    const params = new URLSearchParams({ playerId, playerName });
+    return `${base}/api/rooms/${encodeURIComponent(roomCode)}/ws?${params.toString()}`;
+}
+
+export function useGuessSocket({
+    roomCode,
+    playerId,
+    playerName,
+    onGuess,
+    onOpen,
+}: UseGuessSocketOptions): UseGuessSocketReturn {
+    const socketRef = useRef<WebSocket | null>(null);
+    const pendingRef = useRef<Map<string, PendingGuess>>(new Map());
+    const callbacksRef = useRef({ onGuess, onOpen });
+
+    useEffect(() => {
+        callbacksRef.current = { onGuess, onOpen };
+    }, [onGuess, onOpen]);
+
+    useEffect(() => {
+        const trimmedName = playerName.trim();
+        if (!SOCKET_ENABLED || !roomCode || !trimmedName) return;
+
+        let closed = false;
+        let attempt = 0;
+        let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+        let pingTimer: ReturnType<typeof setInterval> | undefined;
+        const pending = pendingRef.current;
+
+        const rejectPending = () => {
+            for (const { reject } of pending.values()) {
+                reject(new Error("Connexion perdue, réessayez"));
+            }
+            pending.clear();
+        };
+
+        const connect = () => {
+            const socket = new WebSocket(socketUrl(roomCode, playerId, trimmedName));
+            socketRef.current = socket;
+
+            socket.onopen = () => {
+                attempt = 0;
+                pingTimer = setInterval(() => {
+                    socket.send(JSON.stringify({ type: "ping" }));
+                }, PING_INTERVAL_MS);
+                // Catch up on guesses broadcast while disconnected
+                callbacksRef.current.onOpen?.();
+            };
+
+            socket.onmessage = (event) => {
+                const message = JSON.parse(event.data as string) as ServerMessage;
+                if (message.type === "guess") {
+                    callbacksRef.current.onGuess(Guess.fromApi(message.guess));
+                } else if (message.type === "guessResult") {
+                    pending.get(message.requestId)?.resolve(message);
+                    pending.delete(message.requestId);
+                } else if (message.type === "error" && message.requestId) {
+                    pending
+                        .get(message.requestId)
+                        ?.reject(new ApiError(message.detail, message.status, message.suggestions));
+                    pending.delete(message.requestId);
+                }
+            };
+
+            socket.onclose = (event) => {
+                clearInterval(pingTimer);
+                if (socketRef.current === socket) socketRef.current = null;
+                rejectPending();
+                if (closed || FATAL_CLOSE_CODES.has(event.code)) return;
+                if (
+                    event.code === REDIRECT_CLOSE_CODE &&
+                    event.reason &&
+                    event.reason !== getRoomApiUrl(roomCode)
+                ) {
+                    setRoomApiUrl(roomCode, event.reason);
+                    connect();
+                    return;
+                }
+                const delay = Math.min(RECONNECT_MAX_DELAY_MS, 500 * 2 ** attempt);
+                attempt += 1;
+                reconnectTimer = setTimeout(connect, delay);
+            };
+        };
+
+        connect();
+
+        return () => {
+            closed = true;
+            clearTimeout(reconnectTimer);
+            clearInterval(pingTimer);
+            socketRef.current?.close();
+            socketRef.current = null;
+            rejectPending();
+        };
+    }, [roomCode, playerId, playerName]);
+
+    const submitGuess = useCallback((word: string) => {
+        const socket = socketRef.current;
+        if (!socket || socket.readyState !== WebSocket.OPEN) return null;
+
+        const requestId = crypto.randomUUID();
+        return new Promise<SubmitGuessResponse>((resolve, reject) => {
+            pendingRef.current.set(requestId, { resolve, reject });
+            socket.send(JSON.stringify({ type: "guess", word, requestId }));
+        });
+    }, []);
+
+    return { submitGuess };
+}
@@ -5,6 +5,7 @@ interface UseGuessesReturn {
     guesses: Guess[];
     submittedWords: Set<string>;
     addGuess: (guess: Guess) => void;
+    addGuesses: (guesses: Guess[]) => void;
     replaceGuesses: (guesses: Guess[]) => void;
     clearGuesses: () => void;
 }
@@ -19,6 +20,15 @@ export function useGuesses(playerId: string): UseGuessesReturn {
         });
     }, []);
 
+    const addGuesses = useCallback((incoming: Guess[]) => {
+        setGuesses((prev) => {
+            const knownIds = new Set(prev.map((guess) => guess.id));
+            const fresh = incoming.filter((guess) => !knownIds.has(guess.id));
+            if (fresh.length === 0) return prev;
+            return Guess.sortByScore([...prev, ...fresh]);
+        });
+    }, []);
+
     const replaceGuesses = useCallback((nextGuesses: Guess[]) => {
         setGuesses(Guess.sortByScore(nextGuesses));
     }, []);
@@ -36,6 +46,7 @@ export function useGuesses(playerId: string): UseGuessesReturn {
         guesses,
         submittedWords,
         addGuess,
+        addGuesses,
         replaceGuesses,
         clearGuesses,
     };
@@ -1,12 +1,15 @@
-import { useCallback, useRef, useState } from "react";
-import { createRoom, fetchRoomWithGuessesByCode } from "@/api/rooms";
-import { submitGuess } from "@/api/guesses";
+import { useCallback, useEffect, useRef, useState } from "react";
+import { createRoom, fetchHint, fetchRoomSummaryByCode } from "@/api/rooms";
+import { ApiError } from "@/api/client";
+import { fetchGuessesSince, submitGuess } from "@/api/guesses";
 import { useGuesses } from "@/hooks/useGuesses";
+import { useGuessSocket } from "@/hooks/useGuessSocket";
 import { useRoomRealtime } from "@/hooks/useRoomRealtime";
+import type { RoomBatch } from "@/hooks/useRoomRealtime";
 import type { Guess } from "@/models/Guess";
 import type { Room, RoomMode } from "@/models/Room";
 import type { PlayerPresenceData } from "@/models/Player";
-import type { SubmitGuessResponse } from "@/lib/types";
+import type { HintResponse, PlayerSummary, SubmitGuessResponse } from "@/lib/types";
 import { toast } from "@/components/ui/8bit/toast";
 
 interface UseRoomOptions {
@@ -19,6 +22,8 @@ interface UseRoomReturn {
     guesses: Guess[];
     submittedWords: Set<string>;
     presentPlayers: PlayerPresenceData[];
+    playerSummaries: Map<string, PlayerSummary>;
+    hints: HintResponse[];
     isLoading: boolean;
     error: string | null;
     guessValidationPulse: number;
@@ -26,6 +31,7 @@ interface UseRoomReturn {
     createRoom: (mode: RoomMode) => Promise<Room | null>;
     joinRoom: (roomCode: string) => Promise<boolean>;
     submitGuess: (word: string) => Promise<SubmitGuessResponse | null>;
+    requestHint: () => Promise<HintResponse | null>;
     leaveRoom: () => void;
 }
 
@@ -35,27 +41,135 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
     const [error, setError] = useState<string | null>(null);
     const [guessValidationPulse, setGuessValidationPulse] = useState(0);
     const [presentPlayers, setPresentPlayers] = useState<PlayerPresenceData[]>([]);
+    const [playerSummaries, setPlayerSummaries] = useState<Map<string, PlayerSummary>>(
+        () => new Map()
+    );
+    const [hints, setHints] = useState<HintResponse[]>([]);
     const knownPlayersRef = useRef<Set<string>>(new Set());
+    const seenGuessIdsRef = useRef<Set<string>>(new Set());
+    const guessCursorRef = useRef<string | null>(null);
+    const resyncInFlightRef = useRef(false);
+    const activeRoomIdRef = useRef<string | null>(null);
 
-    const { guesses, addGuess, replaceGuesses, clearGuesses, submittedWords } =
+    const { guesses, addGuesses, replaceGuesses, clearGuesses, submittedWords } =
         useGuesses(playerId);
 
+    const applyGuesses = useCallback(
+        (incoming: Guess[]) => {
+            const fresh = incoming.filter((guess) => !seenGuessIdsRef.current.has(guess.id));
+            if (fresh.length === 0) return;
+            for (const guess of fresh) {
+                seenGuessIdsRef.current.add(guess.id);
+            }
 
+            addGuesses(fresh);
+            setPlayerSummaries((prev) => {
+                let next = prev;
+                for (const guess of fresh) {
+                    const current = next.get(guess.playerId);
+                    if (!current) continue;
+                    if (next === prev) next = new Map(prev);
+                    next.set(guess.playerId, {
+                        ...current,
+                        playerName: guess.playerName,
+                        bestScore: Math.max(current.bestScore, guess.score),
+                        guessCount: current.guessCount + 1,
+                    });
+                }
+                return next;
+            });
 
-    const handleRoomUpdate = useCallback((updatedRoom: Room) => {
-        setRoom(updatedRoom);
-    }, []);
+            const winningGuess = fresh.find((guess) => guess.isWinning);
+            if (winningGuess && room?.mode === "coop") {
+                setRoom((prev) => (prev ? prev.withRevealedWord(winningGuess.word) : prev));
+            }
+        },
+        [addGuesses, room?.mode]
+    );
 
     const handleGuessInsert = useCallback(
         (newGuess: Guess) => {
-            addGuess(newGuess);
-            if (newGuess.isWinning && room?.mode === "coop") {
-                setRoom((prev) => (prev ? prev.withRevealedWord(newGuess.word) : prev));
+            applyGuesses([newGuess]);
+        },
+        [applyGuesses]
+    );
+
+    // Fetch only the guesses created after the last server cursor (reconnects, tab refocus)
+    const resyncGuesses = useCallback(async () => {
+        const roomId = room?.id;
+        if (!roomId || resyncInFlightRef.current) return;
+
+        resyncInFlightRef.current = true;
+        try {
+            const { guesses: missed, cursor } = await fetchGuessesSince(
+                roomId,
+                guessCursorRef.current,
+                room?.code
+            );
+            if (activeRoomIdRef.current !== roomId) return;
+            guessCursorRef.current = cursor;
+            applyGuesses(missed);
+        } catch {
+            // Realtime keeps delivering new guesses; the next resync will catch up.
+        } finally {
+            resyncInFlightRef.current = false;
+        }
+    }, [room?.id, room?.code, applyGuesses]);
+
+    const handleBatch = useCallback(
+        (batch: RoomBatch) => {
+            applyGuesses(batch.guesses);
+            if (batch.players.length > 0) {
+                // Stats come from the sending node's cache, which may lag behind what we
+                // already counted: only ever raise them. They also cover players who joined after us.
+                setPlayerSummaries((prev) => {
+                    const next = new Map(prev);
+                    for (const player of batch.players) {
+                        const current = next.get(player.playerId);
+                        next.set(
+                            player.playerId,
+                            current
+                                ? {
+                                      ...player,
+                                      bestScore: Math.max(current.bestScore, player.bestScore),
+                                      guessCount: Math.max(current.guessCount, player.guessCount),
+                                  }
+                                : player
+                        );
+                    }
+                    return next;
+                });
+            }
+            const revealedWord = batch.revealedWord;
+            if (revealedWord) {
+                setRoom((prev) =>
+                    prev && !prev.revealedWord ? prev.withRevealedWord(revealedWord) : prev
+                );
+            }
+            if (batch.truncated) {
+                resyncGuesses();
             }
         },
-        [addGuess, room?.mode]
+        [applyGuesses, resyncGuesses]
     );
 
+    useEffect(() => {
+        activeRoomIdRef.current = room?.id ?? null;
+    }, [room?.id]);
+
+    useEffect(() => {
+        const handleVisibilityChange = () => {
+            if (document.visibilityState === "visible") {
+                resyncGuesses();
+            }
+        };
+
+        document.addEventListener("visibilitychange", handleVisibilityChange);
+        return () => {
+            document.removeEventListener("visibilitychange", handleVisibilityChange);
+        };
+    }, [resyncGuesses]);
+
     const mergePlayers = useCallback(
         (current: PlayerPresenceData[], incoming: PlayerPresenceData[]) => {
             const merged = new Map<string, PlayerPresenceData>();
@@ -108,13 +222,22 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
         roomId: room?.id ?? null,
         playerId,
         playerName,
-        onGuessInsert: handleGuessInsert,
-        onRoomUpdate: handleRoomUpdate,
+        onBatch: handleBatch,
+        onSubscribed: resyncGuesses,
         onPresenceSync: handlePresenceSync,
         onPresenceJoin: handlePresenceJoin,
         onPresenceLeave: handlePresenceLeave,
     });
 
+    // Guesses pushed over the room socket arrive before the next batch; ids dedupe them
+    const { submitGuess: submitGuessOverSocket } = useGuessSocket({
+        roomCode: room?.code ?? null,
+        playerId,
+        playerName,
+        onGuess: handleGuessInsert,
+        onOpen: resyncGuesses,
+    });
+
     const createRoomHandler = useCallback(
         async (mode: RoomMode): Promise<Room | null> => {
             setIsLoading(true);
@@ -124,6 +247,10 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
                 const newRoom = await createRoom(playerName, mode);
                 setRoom(newRoom);
                 replaceGuesses([]);
+                seenGuessIdsRef.current = new Set();
+                guessCursorRef.current = null;
+                setPlayerSummaries(new Map());
+                setHints([]);
                 setPresentPlayers([]);
                 knownPlayersRef.current = new Set();
                 return newRoom;
@@ -144,10 +271,20 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
             setError(null);
 
             try {
-                const { room: foundRoom, guesses: roomGuesses } =
-                    await fetchRoomWithGuessesByCode(roomCode);
+                const {
+                    room: foundRoom,
+                    guesses: roomGuesses,
+                    players,
+                    cursor,
+                } = await fetchRoomSummaryByCode(roomCode, playerId);
                 setRoom(foundRoom);
                 replaceGuesses(roomGuesses);
+                seenGuessIdsRef.current = new Set(roomGuesses.map((guess) => guess.id));
+                guessCursorRef.current = cursor;
+                setPlayerSummaries(
+                    new Map(players.map((player) => [player.playerId, player]))
+                );
+                setHints([]);
                 setPresentPlayers([]);
                 knownPlayersRef.current = new Set();
 
@@ -160,7 +297,7 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
                 setIsLoading(false);
             }
         },
-        [replaceGuesses]
+        [replaceGuesses, playerId]
     );
 
     const submitGuessHandler = useCallback(
@@ -174,12 +311,14 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
             setError(null);
 
             try {
-                const data = await submitGuess({
-                    roomCode: room.code,
-                    playerId,
-                    playerName,
-                    word,
-                });
+                const data =
+                    (await submitGuessOverSocket(word)) ??
+                    (await submitGuess({
+                        roomCode: room.code,
+                        playerId,
+                        playerName,
+                        word,
+                    }));
 
                 const revealedWord = data.revealedWord;
                 if (revealedWord) {
@@ -194,6 +333,9 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
                     message.includes("n'existe pas dans le dictionnaire")
                 ) {
                     setGuessValidationPulse((prev) => prev + 1);
+                    if (err instanceof ApiError && err.suggestions.length > 0) {
+                        toast(`Vouliez-vous dire : ${err.suggestions.join(", ")} ?`);
+                    }
                     return null;
                 }
                 setError(message);
@@ -202,12 +344,31 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
                 setIsLoading(false);
             }
         },
-        [room, playerId, playerName]
+        [room, playerId, playerName, submitGuessOverSocket]
     );
 
+    // Hints are precomputed per room: one small request, no scoring on the server
+    const requestHint = useCallback(async (): Promise<HintResponse | null> => {
+        if (!room) return null;
+        try {
+            const hint = await fetchHint(room.code, hints.length + 1);
+            setHints((prev) =>
+                prev.some((existing) => existing.level === hint.level) ? prev : [...prev, hint]
+            );
+            return hint;
+        } catch (err) {
+            toast(err instanceof Error ? err.message : "Indice indisponible");
+            return null;
+        }
+    }, [room, hints.length]);
+
     const leaveRoom = useCallback(() => {
         setRoom(null);
         clearGuesses();
+        seenGuessIdsRef.current = new Set();
+        guessCursorRef.current = null;
+        setPlayerSummaries(new Map());
+        setHints([]);
         setPresentPlayers([]);
         knownPlayersRef.current = new Set();
         setError(null);
@@ -219,6 +380,8 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
         guesses,
         submittedWords,
         presentPlayers,
+        playerSummaries,
+        hints,
         isLoading,
         error,
         guessValidationPulse,
@@ -226,6 +389,7 @@ export function useRoom({ playerId, playerName }: UseRoomOptions): UseRoomReturn
         createRoom: createRoomHandler,
         joinRoom: joinRoomHandler,
         submitGuess: submitGuessHandler,
+        requestHint,
         leaveRoom,
     };
 }
@@ -1,23 +1,40 @@
 import { useEffect, useRef } from "react";
 import { supabase } from "@/lib/supabase";
 import type { RealtimeChannel } from "@supabase/supabase-js";
-import type { GuessData } from "@/models/Guess";
-import type { RoomData } from "@/models/Room";
 import type { PlayerPresenceData } from "@/models/Player";
+import type { PlayerSummary, RoomBatchPayload } from "@/lib/types";
 import { Guess } from "@/models/Guess";
-import { Room } from "@/models/Room";
+
+// One coalesced update per room and per server tick, whatever the number of guesses
+export interface RoomBatch {
+    guesses: Guess[];
+    players: PlayerSummary[];
+    guessCount: number | null;
+    revealedWord: string | null;
+    truncated: boolean;
+}
 
 interface UseRoomRealtimeOptions {
     roomId: string | null;
     playerId: string;
     playerName: string;
-    onGuessInsert: (guess: Guess) => void;
-    onRoomUpdate: (room: Room) => void;
+    onBatch: (batch: RoomBatch) => void;
+    onSubscribed?: () => void;
     onPresenceSync?: (players: PlayerPresenceData[]) => void;
     onPresenceJoin?: (players: PlayerPresenceData[]) => void;
     onPresenceLeave?: (players: PlayerPresenceData[]) => void;
 }
 
+function toRoomBatch(payload: Partial<RoomBatchPayload>): RoomBatch {
+    return {
+        guesses: (payload.guesses ?? []).map((guess) => Guess.fromApi(guess)),
+        players: payload.players ?? [],
+        guessCount: payload.guessCount ?? null,
+        revealedWord: payload.revealedWord ?? null,
+        truncated: payload.truncated ?? false,
+    };
+}
+
 function isPlayerPresence(value: unknown): value is PlayerPresenceData {
     if (!value || typeof value !== "object") return false;
     const candidate = value as Record<string, unknown>;
@@ -55,15 +72,15 @@ export function useRoomRealtime({
     roomId,
     playerId,
     playerName,
-    onGuessInsert,
-    onRoomUpdate,
+    onBatch,
+    onSubscribed,
     onPresenceSync,
     onPresenceJoin,
     onPresenceLeave,
 }: UseRoomRealtimeOptions): void {
     const callbacksRef = useRef({
-        onGuessInsert,
-        onRoomUpdate,
+        onBatch,
+        onSubscribed,
         onPresenceSync,
         onPresenceJoin,
         onPresenceLeave,
@@ -71,13 +88,19 @@ export function useRoomRealtime({
 
     useEffect(() => {
         callbacksRef.current = {
-            onGuessInsert,
-            onRoomUpdate,
+            onBatch,
+            onSubscribed,
             onPresenceSync,
             onPresenceJoin,
             onPresenceLeave,
         };
-    }, [onGuessInsert, onRoomUpdate, onPresenceSync, onPresenceJoin, onPresenceLeave]);
+    }, [
+        onBatch,
+        onSubscribed,
+        onPresenceSync,
+        onPresenceJoin,
+        onPresenceLeave,
+    ]);
 
     useEffect(() => {
         if (!roomId) return;
@@ -90,32 +113,9 @@ export function useRoomRealtime({
                     },
                 },
             })
-            .on(
-                "postgres_changes",
-                {
-                    event: "INSERT",
-                    schema: "public",
-                    table: "guesses",
-                    filter: `room_id=eq.${roomId}`,
-                },
-                (payload) => {
-                    const newGuess = Guess.fromApi(payload.new as GuessData);
-                    callbacksRef.current.onGuessInsert(newGuess);
-                }
-            )
-            .on(
-                "postgres_changes",
-                {
-                    event: "UPDATE",
-                    schema: "public",
-                    table: "rooms",
-                    filter: `id=eq.${roomId}`,
-                },
-                (payload) => {
-                    const updatedRoom = Room.fromApi(payload.new as RoomData);
-                    callbacksRef.current.onRoomUpdate(updatedRoom);
-                }
-            )
+            .on("broadcast", { event: "batch" }, ({ payload }) => {
+                callbacksRef.current.onBatch(toRoomBatch(payload as Partial<RoomBatchPayload>));
+            })
             .on("presence", { event: "sync" }, () => {
                 const handler = callbacksRef.current.onPresenceSync;
                 if (!handler) return;
@@ -144,6 +144,8 @@ export function useRoomRealtime({
             })
             .subscribe((status) => {
                 if (status !== "SUBSCRIBED") return;
+                // Fires again after every reconnect: catch up on guesses missed meanwhile
+                callbacksRef.current.onSubscribed?.();
                 const trimmedName = playerName.trim();
                 if (!trimmedName) return;
                 roomChannel.track({
@@ -36,6 +36,49 @@ export interface SubmitGuessResponse {
     score: number;
     rank: number | null;
     temperature: number;
+    percentile: number | null;
+    // 1 = the secret; exact inside the top 1000, approximate (interpolated) beyond it
+    vocabularyRank: number | null;
     createdAt: string;
     revealedWord: string | null;
 }
+
+export interface PlayerSummary {
+    playerId: string;
+    playerName: string;
+    bestScore: number;
+    guessCount: number;
+}
+
+export interface RoomSummaryResponse {
+    room: Room;
+    guessCount: number;
+    topGuesses: Guess[];
+    players: PlayerSummary[];
+    playerGuesses: Guess[];
+    recentGuesses: Guess[];
+    cursor: string | null;
+}
+
+// Coalesced room update broadcast by the API on the room channel (event "batch")
+export interface RoomBatchPayload {
+    guesses: Guess[];
+    players: PlayerSummary[];
+    guessCount: number | null;
+    revealedWord: string | null;
+    truncated: boolean;
+}
+
+export interface HintResponse {
+    level: number;
+    levels: number;
+    rank: number;
+    word: string;
+    temperature: number;
+}
+
+export interface GuessPageResponse {
+    guesses: Guess[];
+    nextCursor: string | null;
+    hasMore: boolean;
+}
@@ -1,5 +1,6 @@
 import type { Guess } from "./Guess";
 import { GAME_RULES } from "@/lib/constants";
+import type { PlayerSummary } from "@/lib/types";
 
 /**
  * Raw player presence data from Supabase realtime
@@ -61,11 +62,17 @@ export class PlayerWithStats extends Player {
     private constructor(
         data: PlayerPresenceData,
         guesses: Guess[],
-        currentPlayerId: string
+        currentPlayerId: string,
+        summary?: PlayerSummary
     ) {
         super(data);
-        this.bestScore = this.getBestScore(guesses);
-        this.guessCount = this.getGuessCount(guesses);
+        // Server summaries cover the full history; loaded guesses may only be the top N
+        this.bestScore = summary
+            ? Math.max(summary.bestScore, this.getBestScore(guesses))
+            : this.getBestScore(guesses);
+        this.guessCount = summary
+            ? Math.max(summary.guessCount, this.getGuessCount(guesses))
+            : this.getGuessCount(guesses);
         this.isCurrent = this.isCurrentPlayer(currentPlayerId);
     }
 
@@ -90,7 +97,8 @@ export class PlayerWithStats extends Player {
     static fromPresenceAndGuesses(
         presenceList: PlayerPresenceData[],
         guesses: Guess[],
-        currentPlayerId: string
+        currentPlayerId: string,
+        summaries: Map<string, PlayerSummary> = new Map()
     ): PlayerWithStats[] {
         const playerMap = new Map<string, PlayerPresenceData>();
 
@@ -112,8 +120,21 @@ export class PlayerWithStats extends Player {
             }
         }
 
+        // Add players known only from the server summary
+        for (const summary of summaries.values()) {
+            if (!playerMap.has(summary.playerId)) {
+                playerMap.set(summary.playerId, {
+                    id: summary.playerId,
+                    name: summary.playerName,
+                });
+            }
+        }
+
         return Array.from(playerMap.values())
-            .map((data) => new PlayerWithStats(data, guesses, currentPlayerId))
+            .map(
+                (data) =>
+                    new PlayerWithStats(data, guesses, currentPlayerId, summaries.get(data.id))
+            )
             .sort((a, b) => b.bestScore - a.bestScore);
     }
 }
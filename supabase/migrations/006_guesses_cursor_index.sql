@@ -0,0 +1,6 @@
+-- Match the incremental history query: room_id, then (created_at, id) keyset order
+CREATE INDEX IF NOT EXISTS idx_guesses_room_created_id
+    ON guesses (room_id, created_at, id);
+
+-- Redundant with the new composite index (room_id is its leading column)
+DROP INDEX IF EXISTS idx_guesses_room_id;
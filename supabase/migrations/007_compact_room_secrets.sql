@@ -0,0 +1,10 @@
+-- Compact secret storage: vocabulary index instead of a pgvector literal, and the
+-- top 1000 as packed bytes (u32 word indices + f16 similarities) instead of JSON.
+
+ALTER TABLE room_secrets
+    ADD COLUMN IF NOT EXISTS secret_word_index INTEGER,
+    ADD COLUMN IF NOT EXISTS top_1000_packed BYTEA;
+
+-- New rows no longer write the embedding; legacy rows keep theirs as a fallback
+ALTER TABLE room_secrets
+    ALTER COLUMN secret_embedding DROP NOT NULL;
@@ -0,0 +1,25 @@
+-- Archive for finished or idle rooms (see backend/app/services/retention.py).
+-- One row per room; guesses are kept as a JSON array of
+-- [player_id, player_name, word, score, rank, temperature, created_at].
+CREATE TABLE IF NOT EXISTS archived_rooms (
+    id UUID PRIMARY KEY,
+    code VARCHAR(6) NOT NULL,
+    mode VARCHAR(10),
+    difficulty VARCHAR(10),
+    status VARCHAR(20),
+    revealed_word TEXT,
+    secret_word TEXT,
+    created_at TIMESTAMPTZ,
+    archived_at TIMESTAMPTZ DEFAULT NOW(),
+    guess_count INTEGER NOT NULL DEFAULT 0,
+    guesses JSONB NOT NULL DEFAULT '[]'::jsonb
+);
+
+CREATE INDEX IF NOT EXISTS idx_archived_rooms_code ON archived_rooms(code);
+
+-- Service role only: no public policies
+ALTER TABLE archived_rooms ENABLE ROW LEVEL SECURITY;
+ALTER TABLE archived_rooms FORCE ROW LEVEL SECURITY;
+
+-- Retention candidate scan: status, oldest first
+CREATE INDEX IF NOT EXISTS idx_rooms_status_created ON rooms(status, created_at);
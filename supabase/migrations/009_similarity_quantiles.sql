@@ -0,0 +1,5 @@
+-- Per-secret sorted-similarity quantile table over the allowed vocabulary
+-- (packed float32, see backend/app/utils/packing.py) for percentile/rank of any guess.
+ALTER TABLE room_secrets
+    ADD COLUMN IF NOT EXISTS similarity_quantiles BYTEA,
+    ADD COLUMN IF NOT EXISTS vocabulary_size INTEGER;
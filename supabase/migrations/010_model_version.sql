@@ -0,0 +1,4 @@
+-- Resources (model/lexicon/pools) version a room was created with, so guesses keep
+-- scoring against it after a hot reload (see backend/app/services/model_reload.py)
+ALTER TABLE room_secrets
+    ADD COLUMN IF NOT EXISTS model_version TEXT;
@@ -0,0 +1,3 @@
+-- Hint ladder precomputed at room creation: [{level, rank, word, temperature}, ...]
+ALTER TABLE room_secrets
+    ADD COLUMN IF NOT EXISTS hints JSONB;
@@ -0,0 +1,18 @@
+-- Room updates are now broadcast by the API as coalesced per-room batches
+-- (backend/app/services/room_broadcast.py): stop replicating every guesses/rooms
+-- row change to Realtime. Apply once clients use the broadcast channel.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_publication_tables
+        WHERE pubname = 'supabase_realtime' AND schemaname = 'public' AND tablename = 'guesses'
+    ) THEN
+        ALTER PUBLICATION supabase_realtime DROP TABLE guesses;
+    END IF;
+    IF EXISTS (
+        SELECT 1 FROM pg_publication_tables
+        WHERE pubname = 'supabase_realtime' AND schemaname = 'public' AND tablename = 'rooms'
+    ) THEN
+        ALTER PUBLICATION supabase_realtime DROP TABLE rooms;
+    END IF;
+END $$;
@@ -0,0 +1,28 @@
+-- Retention candidates (backend/app/services/retention.py): rooms of a status with no
+-- activity since the cutoff, i.e. created before it and without any later guess.
+-- For finished rooms the last guess is the winning one, so the age counts from the
+-- finish, not from creation. Filtering in SQL keeps busy old rooms from occupying the
+-- head of every batch. NOT EXISTS is served by idx_guesses_room_created_id.
+CREATE OR REPLACE FUNCTION retention_candidates(
+    p_status TEXT,
+    p_cutoff TIMESTAMPTZ,
+    p_limit INTEGER
+)
+RETURNS SETOF rooms
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT r.*
+    FROM rooms r
+    WHERE r.status = p_status
+      AND r.created_at < p_cutoff
+      AND NOT EXISTS (
+          SELECT 1 FROM guesses g
+          WHERE g.room_id = r.id AND g.created_at >= p_cutoff
+      )
+    ORDER BY r.created_at
+    LIMIT p_limit;
+$$;
+
+REVOKE EXECUTE ON FUNCTION retention_candidates(TEXT, TIMESTAMPTZ, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION retention_candidates(TEXT, TIMESTAMPTZ, INTEGER) TO service_role;
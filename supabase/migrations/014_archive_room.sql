@@ -0,0 +1,65 @@
+-- Room archival in one transaction (backend/app/services/retention.py): copy the room,
+-- its secret word and all its guesses to archived_rooms, then delete the live room,
+-- which cascades to room_secrets and guesses.
+-- The room row is locked first: guess inserts take a key share lock on it through
+-- their foreign key, so they wait for the archive and then fail instead of being
+-- deleted unarchived. Reading in SQL also avoids the PostgREST max-rows cap.
+-- Returns the number of archived guesses, or NULL when the room no longer exists.
+CREATE OR REPLACE FUNCTION archive_room(p_room_id UUID)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_room rooms%ROWTYPE;
+    v_guess_count INTEGER;
+BEGIN
+    SELECT * INTO v_room FROM rooms WHERE id = p_room_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    -- Upsert keeps the function idempotent with rows left by the former client-side job
+    INSERT INTO archived_rooms (
+        id, code, mode, difficulty, status, revealed_word, secret_word, created_at,
+        guess_count, guesses
+    )
+    VALUES (
+        v_room.id,
+        v_room.code,
+        v_room.mode,
+        v_room.difficulty,
+        v_room.status,
+        v_room.revealed_word,
+        (SELECT s.secret_word FROM room_secrets s WHERE s.room_id = v_room.id),
+        v_room.created_at,
+        (SELECT COUNT(*) FROM guesses g WHERE g.room_id = v_room.id),
+        (
+            SELECT COALESCE(
+                jsonb_agg(
+                    jsonb_build_array(
+                        g.player_id, g.player_name, g.word, g.score, g.rank, g.temperature, g.created_at
+                    )
+                    ORDER BY g.created_at, g.id
+                ),
+                '[]'::jsonb
+            )
+            FROM guesses g
+            WHERE g.room_id = v_room.id
+        )
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        status = EXCLUDED.status,
+        revealed_word = EXCLUDED.revealed_word,
+        secret_word = EXCLUDED.secret_word,
+        archived_at = NOW(),
+        guess_count = EXCLUDED.guess_count,
+        guesses = EXCLUDED.guesses
+    RETURNING guess_count INTO v_guess_count;
+
+    DELETE FROM rooms WHERE id = v_room.id;
+    RETURN v_guess_count;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION archive_room(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION archive_room(UUID) TO service_role;